@@ -0,0 +1,178 @@
+"""Physics microbenchmarks: nanoseconds per ball-step for every physics engine
+
+Builds the real board headless and steps populations of 1 to 10k balls,
+recycling balls to the top as they reach the multiplier zones so the
+population stays constant.
+
+    python -m benchmarks.physics_bench --save bench_physics.json
+    python -m benchmarks.physics_bench --baseline bench_physics.json
+"""
+import os
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from core.game_objects import Ball as LegacyBall
+from physics import board as board_layout
+from physics.ball_physics import BallPhysics
+from physics.batch_physics import BatchBallPhysics, np
+from physics.game_objects import Ball
+from physics.simulation import Board
+
+BALL_COUNTS = (1, 10, 100, 1000, 10000)
+
+def spawn_position(board, rng):
+    """Get a random position somewhere above the multiplier zones"""
+    left = board.boundaries['left'] + board_layout.BALL_RADIUS
+    right = board.boundaries['right'] - board_layout.BALL_RADIUS
+    return rng.uniform(left, right), rng.uniform(board_layout.BALL_START_Y, board.zone_top)
+
+def respawn(ball, board, rng):
+    """Send a ball back to the top of the board"""
+    ball.x, ball.y = board.width / 2 + rng.uniform(-20, 20), board_layout.BALL_START_Y
+    ball.dx, ball.dy = rng.uniform(-0.8, 0.8), 2
+
+def scalar_stepper(board, count, rng, use_index=True):
+    """Step function for BallPhysics.update_position over a list of balls"""
+    physics = BallPhysics(pin_index=board.pin_index if use_index else None, rng=rng)
+    balls = []
+    for _ in range(count):
+        x, y = spawn_position(board, rng)
+        balls.append(Ball(x, y, board_layout.BALL_RADIUS, (255, 200, 0), 1.0))
+
+    def step():
+        for ball in balls:
+            physics.update_position(ball, board.pin_positions, board.boundaries)
+            if ball.y >= board.zone_top:
+                respawn(ball, board, rng)
+    return step
+
+def legacy_stepper(board, count, rng):
+    """Step function for the older core.game_objects.Ball.update"""
+    balls = []
+    for _ in range(count):
+        x, y = spawn_position(board, rng)
+        balls.append(LegacyBall(x, y, board_layout.BALL_RADIUS, (255, 200, 0), 1.0))
+
+    def step():
+        for ball in balls:
+            if ball.update(board.pin_positions, board.boundaries, board.multipliers,
+                           board.multiplier_rects, lambda winnings: None):
+                respawn(ball, board, rng)
+                ball.active = True
+    return step
+
+def batch_stepper(board, count, rng, continuous=False):
+    """Step function for the vectorized BatchBallPhysics"""
+    engine = BatchBallPhysics(capacity=count, rng=np.random.default_rng(rng.getrandbits(32)))
+    engine.set_pins(board.pin_positions, board.pin_index)
+    if continuous:
+        engine.enable_continuous_collision(board_layout.PIN_RADIUS)
+    for _ in range(count):
+        x, y = spawn_position(board, rng)
+        engine.add_ball(x, y, 0.0, 0.0, board_layout.BALL_RADIUS, (255, 200, 0), 1.0)
+
+    def step():
+        engine.step(board.boundaries)
+        done = np.flatnonzero(engine.y[:count] >= board.zone_top)
+        if len(done):
+            engine.x[done] = board.width / 2 + engine.rng.uniform(-20, 20, len(done))
+            engine.y[done] = board_layout.BALL_START_Y
+            engine.dx[done] = engine.rng.uniform(-0.8, 0.8, len(done))
+            engine.dy[done] = 2
+    return step
+
+def get_engines():
+    """Map engine name to a stepper factory(board, count, rng)"""
+    engines = {
+        'ball_physics': scalar_stepper,
+        'ball_physics_brute': lambda board, count, rng: scalar_stepper(board, count, rng, use_index=False),
+        'legacy_ball_update': legacy_stepper,
+    }
+    if BatchBallPhysics.available():
+        engines['batch'] = batch_stepper
+        engines['batch_continuous'] = lambda board, count, rng: batch_stepper(board, count, rng, True)
+    return engines
+
+def measure(factory, board, count, budget, seed):
+    """Get the mean nanoseconds per ball-step for one engine and population size"""
+    rng = random.Random(seed)
+    step = factory(board, count, rng)
+    for _ in range(3):
+        step()  # Warm up
+
+    ticks = max(3, budget // count)
+    start = time.perf_counter_ns()
+    for _ in range(ticks):
+        step()
+    return (time.perf_counter_ns() - start) / (ticks * count)
+
+def run(engines, counts, budget, seed=0):
+    """Benchmark every engine at every population size"""
+    board = Board()
+    results = {}
+    for name in engines:
+        factory = get_engines()[name]
+        results[name] = {}
+        for count in counts:
+            results[name][str(count)] = measure(factory, board, count, budget, seed)
+            print(f"{name:>20} {count:>6} balls: {results[name][str(count)]:>10.0f} ns/ball-step",
+                  file=sys.stderr)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__ if np is not None else None,
+            'budget': budget,
+        },
+        'results': results,
+    }
+
+def compare(report, baseline, tolerance):
+    """Compare a report with a baseline. Returns (lines, number of regressions)."""
+    lines = []
+    regressions = 0
+    for name, timings in report['results'].items():
+        for count, ns in timings.items():
+            base = baseline.get('results', {}).get(name, {}).get(count)
+            if base is None:
+                continue
+            ratio = ns / base
+            flag = ''
+            if ratio > 1 + tolerance:
+                flag = '  REGRESSION'
+                regressions += 1
+            lines.append(f"{name:>20} {count:>6}: {base:>10.0f} -> {ns:>10.0f} ns ({ratio:.2f}x){flag}")
+    return lines, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ns per ball-step for each physics engine")
+    parser.add_argument('--engines', nargs='+', help="engines to run (default: all available)")
+    parser.add_argument('--counts', nargs='+', type=int, default=list(BALL_COUNTS))
+    parser.add_argument('--budget', type=int, default=200000, help="ball-steps to time per measurement")
+    parser.add_argument('--save', metavar='PATH', help="write results as JSON")
+    parser.add_argument('--baseline', metavar='PATH', help="compare against saved JSON results")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="allowed slowdown before flagging")
+    args = parser.parse_args(argv)
+
+    report = run(args.engines or list(get_engines()), args.counts, args.budget)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            lines, regressions = compare(report, json.load(f), args.tolerance)
+        print('\n'.join(lines), file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Rendering benchmark: milliseconds per draw() for every screen, headless
+
+Runs under SDL's dummy video driver so it works without a display:
+
+    python -m benchmarks.render_bench --frames 200 --save bench_render.json
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import pygame
+
+from core.fonts import fonts
+from core.settings import SettingsManager
+from core.text_cache import text_cache
+from physics import board as board_layout
+from state.game_state import GameState
+
+GAME_BALL_COUNTS = (0, 10, 100, 1000)
+
+class BenchSettings(SettingsManager):
+    """Settings loaded as usual but never written back"""
+
+    def __init__(self, overrides=None):
+        super().__init__()
+        self.settings.update(overrides or {})
+
+    def save_settings(self, settings=None):
+        if settings is not None:
+            self.settings = settings
+
+def noop(*args):
+    """Stand-in for screen navigation callbacks"""
+    return None
+
+def populate(game, count, rng):
+    """Scatter count balls over the board of a GameScreen"""
+    boundaries = board_layout.create_boundaries(game.settings_manager.get_setting('width'),
+                                                game.settings_manager.get_setting('height'))
+    zone_top = min(rect.top for rect in game.multiplier_rects)
+    for _ in range(count):
+        x = rng.uniform(boundaries['left'] + board_layout.BALL_RADIUS,
+                        boundaries['right'] - board_layout.BALL_RADIUS)
+        y = rng.uniform(board_layout.BALL_START_Y, zone_top)
+        ball = game.ball_pool.acquire(x, y, board_layout.BALL_RADIUS, (255, 200, 0), 1.0)
+        ball.collision_flash = rng.choice((0, 0, 0, 5, 10))
+        game.balls.append(ball)
+
+def get_cases(settings, game_state, ball_counts):
+    """Map case name to a factory returning (drawable, update or None)"""
+    from ui.menu_screen import MenuScreen
+    from ui.settings_screen import SettingsScreen
+    from ui.shop_screen import ShopScreen
+    from ui.skins_screen import SkinsScreen
+    from ui_components.dashboard import Dashboard
+    from ui_components.game_screen import GameScreen
+
+    def menu():
+        screen = MenuScreen(settings, noop, noop, noop, noop, noop)
+        return screen, screen.update
+
+    def game(count):
+        screen = GameScreen(settings, game_state, noop, noop)
+        populate(screen, count, random.Random(count))
+        return screen, None  # Keep the ball count fixed
+
+    def shop():
+        return ShopScreen(settings, noop, game_state.coins, game_state.purchased_skins), None
+
+    def skins():
+        screen = SkinsScreen(settings, noop, game_state.purchased_skins, game_state.active_ball_skin, noop)
+        return screen, getattr(screen, 'update', None)
+
+    def settings_screen():
+        return SettingsScreen(settings, noop), None
+
+    def dashboard():
+        widget = Dashboard(settings, noop, game_state)
+        return widget, widget.update
+
+    cases = {'menu': menu}
+    for count in ball_counts:
+        cases[f'game_{count}'] = lambda count=count: game(count)
+    cases.update({'shop': shop, 'skins': skins, 'settings': settings_screen, 'dashboard': dashboard})
+    return cases
+
+def percentile(sorted_values, fraction):
+    """Get a percentile of already sorted values by nearest rank"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def measure(drawable, update, surface, frames, warmup=5):
+    """Time drawable.draw(surface) for a number of frames. Returns ms statistics."""
+    timings = []
+    for frame in range(warmup + frames):
+        if update:
+            update()
+        surface.fill((0, 0, 0))
+        start = time.perf_counter_ns()
+        drawable.draw(surface)
+        elapsed = time.perf_counter_ns() - start
+        if frame >= warmup:
+            timings.append(elapsed / 1e6)
+
+    timings.sort()
+    return {
+        'mean': sum(timings) / len(timings),
+        'p50': percentile(timings, 0.50),
+        'p90': percentile(timings, 0.90),
+        'p99': percentile(timings, 0.99),
+        'max': timings[-1],
+    }
+
+def run(case_names=None, frames=200, ball_counts=GAME_BALL_COUNTS, overrides=None):
+    """Benchmark the draw() of each case"""
+    pygame.init()
+    fonts.preload()
+    settings = BenchSettings(overrides)
+    surface = pygame.display.set_mode(settings.get_window_size())
+
+    game_state = GameState()
+    game_state.coins = 1000
+    random.seed(0)
+
+    cases = get_cases(settings, game_state, ball_counts)
+    results = {}
+    for name in case_names or cases:
+        drawable, update = cases[name]()
+        results[name] = measure(drawable, update, surface, frames)
+        stats = results[name]
+        print(f"{name:>12}: p50 {stats['p50']:7.3f} ms  p90 {stats['p90']:7.3f} ms  "
+              f"p99 {stats['p99']:7.3f} ms", file=sys.stderr)
+    pygame.quit()
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+            'platform': platform.platform(),
+            'video_driver': os.environ['SDL_VIDEODRIVER'],
+            'window': list(settings.get_window_size()),
+            'dark_mode': settings.get_setting('dark_mode', False),
+            'frames': frames,
+            'fonts_loaded': fonts.loaded,
+            'text_cache': text_cache.get_stats(),
+        },
+        'results': results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ms per draw() for each screen")
+    parser.add_argument('--cases', nargs='+', help="cases to run (default: all)")
+    parser.add_argument('--frames', type=int, default=200, help="timed frames per case")
+    parser.add_argument('--balls', nargs='+', type=int, default=list(GAME_BALL_COUNTS),
+                        help="ball counts for the game screen cases")
+    parser.add_argument('--dark-mode', action='store_true')
+    parser.add_argument('--save', metavar='PATH', help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.cases, args.frames, args.balls, {'dark_mode': args.dark_mode})
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Startup benchmark: time from launch to the first frame on screen
+
+Launches main.py repeatedly with --profile-startup --exit-after-first-frame,
+each time in a fresh temporary directory (so settings are created from
+defaults, as on a first launch), and reports the median of each phase.
+
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --runs 20 --save bench_startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+# Matches one row of StartupTimeline.report()
+PHASE_LINE = re.compile(r'^(.*\S)\s+([\d.]+) ms$')
+
+def launch(display=False):
+    """Run the game to its first frame once. Returns ({phase: ms}, process wall-clock ms)."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    if not display:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, MAIN, '--profile-startup', '--exit-after-first-frame'],
+                                cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout
+        wall_ms = (time.perf_counter() - start) * 1000
+
+    phases = {}
+    for line in output.splitlines():
+        match = PHASE_LINE.match(line)
+        if match:
+            phases[match.group(1)] = float(match.group(2))
+    return phases, wall_ms
+
+def run(runs, display=False):
+    """Launch the game runs times and get the median of every phase"""
+    samples = []
+    walls = []
+    for _ in range(runs):
+        phases, wall_ms = launch(display)
+        samples.append(phases)
+        walls.append(wall_ms)
+
+    phases = {name: statistics.median(sample[name] for sample in samples) for name in samples[0]}
+    return {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(), 'runs': runs,
+                 'video_driver': None if display else os.environ.get('SDL_VIDEODRIVER', 'dummy')},
+        'phases': phases,
+        'process_ms': statistics.median(walls),  # Includes interpreter start-up and shutdown
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ms from launch to the first frame")
+    parser.add_argument('--runs', type=int, default=10, help="launches to take the median of")
+    parser.add_argument('--target', type=float, default=300.0, help="ms allowed to the first frame")
+    parser.add_argument('--display', action='store_true', help="open a real window instead of the dummy driver")
+    parser.add_argument('--save', metavar='PATH', help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs, args.display)
+    width = max(len(name) for name in results['phases'])
+    for name, ms in results['phases'].items():
+        print(f"{name:<{width}} {ms:8.1f} ms")
+    print(f"{'process':<{width}} {results['process_ms']:8.1f} ms (launch to exit)")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    total = results['phases']['total']
+    if total > args.target:
+        print(f"time to first frame {total:.1f} ms is over the {args.target:.0f} ms target")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import time
+
+import pygame
+
+class HitIndex:
+    """Finds which of a screen's named rects contains a point.
+
+    Keeps the names and copies of the rects as tuples, plus their bounding
+    box, so a miss costs one collidepoint and a hit one C-level collidelist
+    instead of a Python loop over every button. update() rebuilds them only
+    when the buttons or their rects have changed.
+    """
+
+    def __init__(self):
+        self.names = ()
+        self.rects = ()
+        self.bounds = None
+        self.probe = pygame.Rect(0, 0, 1, 1)
+
+    def update(self, buttons):
+        """Re-index a {name: rect} dict if it changed since the last call"""
+        names = tuple(buttons)
+        rects = tuple(buttons.values())
+        if names != self.names or rects != self.rects:
+            self.names = names
+            self.rects = tuple(pygame.Rect(rect) for rect in rects)  # Copies, so moved rects are noticed
+            self.bounds = self.rects[0].unionall(self.rects[1:]) if self.rects else None
+
+    def hit(self, pos):
+        """Name of the first rect containing pos, or None"""
+        if self.bounds is None or not self.bounds.collidepoint(pos):
+            return None
+        self.probe.topleft = pos
+        index = self.probe.collidelist(self.rects)
+        return self.names[index] if index != -1 else None
+
+def hover(screen, event):
+    """Screen handler: update the hover state for the pointer position"""
+    return screen.update_hover_state(event.pos)
+
+def click(screen, event):
+    """Screen handler: pass a click to the screen"""
+    return screen.handle_click(event.pos)
+
+class EventDispatcher:
+    """Delivers each frame's events to the current screen through a handler table.
+
+    Runs of consecutive MOUSEMOTION events collapse to the last one, so a fast
+    mouse costs one hover update per frame instead of dozens. Screen handlers
+    are looked up in a table per screen class, built the first time a screen of
+    that class is seen from the methods it has, and called as handler(screen,
+    event). Whatever they return goes to on_result. Global handlers (QUIT)
+    take just the event and run whichever screen is shown.
+    """
+
+    def __init__(self, get_screen, on_result=None, smoothing=0.1):
+        self.get_screen = get_screen  # Returns the screen to route to (it can change mid-frame)
+        self.on_result = on_result
+        self.smoothing = smoothing  # Weight of the newest frame in average_ms
+        self.observers = []  # Called with every event before routing, coalesced motion included
+        self.handlers = {}  # Event type -> handler(event), for every screen
+        self.tables = {}  # Screen class -> {event type: handler(screen, event)}
+
+        # Cost of the last frame's events, and a moving average
+        self.event_ms = 0.0
+        self.average_ms = 0.0
+        self.events = 0
+        self.coalesced = 0
+
+    def register(self, event_type, handler, screen_class=None):
+        """Add a handler for an event type, for every screen or just one screen class"""
+        if screen_class is None:
+            self.handlers[event_type] = handler
+        else:
+            self.get_table(screen_class)[event_type] = handler
+
+    def get_table(self, screen_class):
+        """Get the handler table for a screen class, building it on first use"""
+        table = self.tables.get(screen_class)
+        if table is None:
+            table = self.tables[screen_class] = {}
+            if hasattr(screen_class, 'update_hover_state'):
+                table[pygame.MOUSEMOTION] = hover
+            if hasattr(screen_class, 'handle_click'):
+                table[pygame.MOUSEBUTTONDOWN] = click
+        return table
+
+    def dispatch(self, events):
+        """Handle one frame's events and record how long that took"""
+        start = time.perf_counter()
+        motion = None  # Latest motion event not yet delivered
+        coalesced = 0
+        for event in events:
+            for observer in self.observers:
+                observer(event)
+            if event.type == pygame.MOUSEMOTION:
+                if motion is not None:
+                    coalesced += 1
+                motion = event
+                continue
+            # Deliver pending motion first so the screen sees events in order
+            if motion is not None:
+                self.route(motion)
+                motion = None
+            self.route(event)
+        if motion is not None:
+            self.route(motion)
+
+        self.events = len(events)
+        self.coalesced = coalesced
+        self.event_ms = (time.perf_counter() - start) * 1000
+        self.average_ms += (self.event_ms - self.average_ms) * self.smoothing
+        return self.event_ms
+
+    def route(self, event):
+        """Send one event to its global handler, or else to the current screen's"""
+        handler = self.handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+            return
+        screen = self.get_screen()
+        if screen is None:
+            return
+        handler = self.get_table(type(screen)).get(event.type)
+        if handler is not None:
+            result = handler(screen, event)
+            if result is not None and self.on_result:
+                self.on_result(result)
+
+    def get_stats(self):
+        """Get the last frame's event count, coalesced motions and cost, and the average cost"""
+        return {
+            'events': self.events,
+            'coalesced': self.coalesced,
+            'event_ms': self.event_ms,
+            'average_ms': self.average_ms,
+        }
@@ -0,0 +1,38 @@
+import pygame
+
+# (face, size) of every font the screens use, loaded once at startup
+DEFAULT_FONTS = [
+    (None, 20), (None, 24), (None, 28), (None, 32), (None, 36),
+    (None, 40), (None, 48), (None, 74),
+]
+
+class FontRegistry:
+    """Loads each (face, size) font once and hands back the shared instance"""
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, size, face=None):
+        """Get the font for a face (None for pygame's default) and size, loading it on first use"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(face, size)
+        return font
+
+    def preload(self, specs=DEFAULT_FONTS):
+        """Load a list of (face, size) fonts up front"""
+        for face, size in specs:
+            self.get(size, face)
+
+    @property
+    def loaded(self):
+        """Number of distinct fonts loaded so far"""
+        return len(self.fonts)
+
+# Shared by every screen
+fonts = FontRegistry()
+
+def get_font(size, face=None):
+    """Get a shared font from the registry"""
+    return fonts.get(size, face)
@@ -0,0 +1,68 @@
+# Quality ladder, cheapest last. Screens read the level they can act on from `quality`.
+QUALITY_FULL = 0
+QUALITY_NO_GLOW = 1  # No collision glow; smaller ball sprites
+QUALITY_PLAIN = 2  # Balls as single flat circles
+QUALITY_NO_INTERPOLATION = 3  # Draw balls where the last tick left them
+QUALITY_ALTERNATE_FRAMES = 4  # Draw every other frame; the simulation still runs every tick
+
+QUALITY_NAMES = ['full', 'no glow', 'plain circles', 'no interpolation', 'alternate frames']
+
+class FrameBudget:
+    """Steps rendering quality down when update + draw overrun the frame budget, and back up with headroom"""
+
+    def __init__(self, frame_rate=60, headroom=0.6, step_down_after=10, step_up_after=120,
+                 smoothing=0.2, max_level=QUALITY_ALTERNATE_FRAMES):
+        self.budget_ms = 1000.0 / frame_rate
+        self.headroom = headroom  # Step up once frames fit in this fraction of the budget
+        self.step_down_after = step_down_after  # Frames over budget before stepping down
+        self.step_up_after = step_up_after  # Frames with headroom before stepping up
+        self.smoothing = smoothing  # Weight of the newest sample in the moving averages
+        self.max_level = max_level
+
+        self.level = QUALITY_FULL
+        self.update_ms = 0.0  # Moving averages of the measured work
+        self.draw_ms = 0.0
+        self.over = 0
+        self.under = 0
+
+    @property
+    def level_name(self):
+        """Human-readable name of the current quality level"""
+        return QUALITY_NAMES[self.level]
+
+    @property
+    def frame_ms(self):
+        """Smoothed cost of one frame"""
+        return self.update_ms + self.draw_ms
+
+    def should_draw(self, frame):
+        """Whether to draw this frame number at the current level"""
+        return self.level < QUALITY_ALTERNATE_FRAMES or frame % 2 == 0
+
+    def record(self, update_ms, draw_ms=None):
+        """Add one frame's measured update and draw time (draw_ms None if the draw was skipped).
+        Returns the quality level to use next."""
+        self.update_ms += (update_ms - self.update_ms) * self.smoothing
+        if draw_ms is not None:
+            self.draw_ms += (draw_ms - self.draw_ms) * self.smoothing
+
+        if self.frame_ms > self.budget_ms:
+            self.over += 1
+            self.under = 0
+            if self.over >= self.step_down_after and self.level < self.max_level:
+                self.set_level(self.level + 1)
+        elif self.frame_ms < self.budget_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+            if self.under >= self.step_up_after and self.level > QUALITY_FULL:
+                self.set_level(self.level - 1)
+        else:
+            self.over = 0
+            self.under = 0
+        return self.level
+
+    def set_level(self, level):
+        """Jump to a quality level and start measuring afresh"""
+        self.level = max(QUALITY_FULL, min(self.max_level, level))
+        self.over = 0
+        self.under = 0
@@ -0,0 +1,85 @@
+import pygame
+
+# Events that mean someone is using the game
+INPUT_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.KEYUP)
+
+class FrameGovernor:
+    """Picks how often the main loop runs from screen activity and window state.
+
+    Modes:
+        'active'      full frame rate while the screen animates or was just used
+        'idle'        nothing moving: block until an event arrives, redrawing at
+                      idle_rate at most (enough for clocks like the lucky charm timer)
+        'background'  window unfocused but something is moving: a low steady rate
+        'minimized'   nothing is visible: tick slowly and skip drawing
+    """
+
+    def __init__(self, frame_rate=60, idle_rate=4, background_rate=15, linger_ms=500):
+        self.frame_rate = frame_rate
+        self.idle_rate = idle_rate
+        self.background_rate = background_rate
+        self.linger_ms = linger_ms  # Stay at full rate this long after input (hover effects)
+
+        self.focused = True
+        self.minimized = False
+        self.last_input = pygame.time.get_ticks()
+        self.mode = 'active'
+        self.woken_by = None  # Event that ended an idle wait, not yet handed out
+
+    def handle_event(self, event):
+        """Track window focus, minimizing and user input"""
+        if event.type in INPUT_EVENTS:
+            self.last_input = pygame.time.get_ticks()
+            self.mode = 'active'  # Snap back right away
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self.last_input = pygame.time.get_ticks()
+        elif event.type == pygame.WINDOWMINIMIZED:
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+            self.minimized = False
+
+    def update(self, screen):
+        """Choose the mode for the next frame. Returns it."""
+        is_animating = getattr(screen, 'is_animating', None)
+        animating = is_animating() if is_animating else True  # Assume the worst for unknown screens
+
+        if self.minimized:
+            self.mode = 'minimized'
+        elif not self.focused:
+            self.mode = 'background' if animating else 'idle'
+        elif animating or pygame.time.get_ticks() - self.last_input < self.linger_ms:
+            self.mode = 'active'
+        else:
+            self.mode = 'idle'
+        return self.mode
+
+    @property
+    def should_draw(self):
+        """False while nothing is visible"""
+        return self.mode != 'minimized'
+
+    def wait(self, clock):
+        """Sleep until the next frame is due and return the milliseconds since the last one"""
+        if self.mode == 'active':
+            return clock.tick(self.frame_rate)
+        if self.mode == 'background':
+            return clock.tick(self.background_rate)
+
+        # Idle or minimized: sleep in the event queue so input wakes us immediately
+        timeout = 1000 // (self.idle_rate if self.mode == 'idle' else 1)
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self.woken_by = event  # Handed out first by get_events so input stays in order
+        return clock.tick()
+
+    def get_events(self):
+        """Get this frame's events, starting with the one that woke an idle wait"""
+        events = pygame.event.get()
+        if self.woken_by is not None:
+            events.insert(0, self.woken_by)
+            self.woken_by = None
+        return events
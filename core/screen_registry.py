@@ -0,0 +1,44 @@
+class ScreenRegistry:
+    """Builds each screen the first time it is shown and keeps it for reuse.
+
+    Switching screens calls on_exit() on the one being left and
+    on_enter(**get_state()) on the one being shown, so screens refresh what changed
+    while they were away instead of being rebuilt. A screen is only rebuilt
+    when layout_key() (e.g. the window size) differs from when it was built.
+    """
+
+    def __init__(self, layout_key=None):
+        self.layout_key = layout_key or (lambda: None)
+        self.factories = {}
+        self.screens = {}  # name -> (screen, layout key it was built for)
+        self.current = None
+        self.current_name = None
+
+    def register(self, name, factory):
+        """Add a screen by name. factory() builds it and is called at most once per layout."""
+        self.factories[name] = factory
+
+    def get(self, name):
+        """Get a screen, building it if it doesn't exist yet or its layout is stale"""
+        key = self.layout_key()
+        entry = self.screens.get(name)
+        if entry is None or entry[1] != key:
+            entry = self.screens[name] = (self.factories[name](), key)
+        return entry[0]
+
+    def show(self, name, get_state=None):
+        """Make a screen current, running the exit and enter hooks. Returns the screen.
+
+        get_state() returns the keyword arguments for on_enter. It is called after
+        the exit hook, so it sees anything that hook changed (e.g. wins paid out).
+        """
+        screen = self.get(name)
+        if screen is not self.current:
+            if self.current is not None and hasattr(self.current, 'on_exit'):
+                self.current.on_exit()
+            self.current = screen
+            self.current_name = name
+        if hasattr(screen, 'on_enter'):
+            screen.on_enter(**(get_state() if get_state else {}))
+        return screen
+
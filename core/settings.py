@@ -17,7 +17,16 @@ class SettingsManager:
                 'height': 600,
                 'dark_mode': False,
                 'volume': 0.5,
-                'fullscreen': False
+                'fullscreen': False,
+                'physics_engine': 'scalar',  # 'scalar', 'batch' (NumPy) or 'playback' (recorded paths)
+                'ball_collisions': False,
+                'continuous_collision': False,
+                'max_live_balls': 300,  # Queued auto/burst drops wait above this
+                'auto_drop_count': 50,
+                'auto_drop_rate': 5,  # Balls per second
+                'burst_size': 10,
+                'dirty_rects': False,  # Redraw and push only changed areas (software displays)
+                'simulation_thread': False  # Step the balls on a worker thread
             }
             self.save_settings(default_settings)
             return default_settings
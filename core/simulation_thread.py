@@ -0,0 +1,131 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+# What the renderer needs from one ball (duck-types as a Ball for BallSprites.get_blits)
+BallState = namedtuple('BallState', 'x y prev_x prev_y radius color collision_flash')
+
+def drain_queue(items):
+    """Take everything currently in a queue without blocking"""
+    drained = []
+    while True:
+        try:
+            drained.append(items.get_nowait())
+        except queue.Empty:
+            return drained
+
+class BatchState:
+    """Frozen copy of a BatchBallPhysics' drawable arrays (duck-types as the engine for drawing)"""
+
+    __slots__ = ('count', 'x', 'y', 'prev_x', 'prev_y', 'radius', 'colors', 'collision_flash')
+
+    def __init__(self, engine):
+        n = engine.count
+        self.count = n
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'radius', 'collision_flash'):
+            array = getattr(engine, name)[:n].copy()
+            array.flags.writeable = False
+            setattr(self, name, array)
+        self.colors = tuple(engine.colors[:n])
+
+class Snapshot:
+    """Immutable state of the board after one simulation tick"""
+
+    __slots__ = ('tick', 'time', 'balls', 'batch')
+
+    def __init__(self, tick, balls=(), batch=None):
+        self.tick = tick
+        self.time = time.perf_counter()  # When the tick finished, for interpolation
+        self.balls = balls  # Tuple of BallState
+        self.batch = batch  # BatchState or None
+
+    @property
+    def live(self):
+        """Number of balls in flight"""
+        return len(self.balls) + (self.batch.count if self.batch else 0)
+
+class SimulationThread:
+    """Runs a simulation step on a worker thread at a fixed tick rate.
+
+    The worker only touches simulation objects. Everything else crosses
+    threads through queues (drops in, wins out) or through published
+    snapshots: each tick the worker builds a new immutable Snapshot and
+    swaps it in with a single reference assignment, so the render loop reads
+    the latest one without locking and keeps a consistent view for as long
+    as it holds the reference.
+    """
+
+    def __init__(self, step, take_snapshot, tick_rate=60, max_ticks=5):
+        self.step = step  # Advances the simulation one tick (worker thread only)
+        self.take_snapshot = take_snapshot  # Builds a Snapshot of the simulation for a tick number
+        self.tick_seconds = 1.0 / tick_rate
+        self.max_ticks = max_ticks  # Most catch-up ticks before we drop time
+
+        self.drops = queue.SimpleQueue()  # Bets whose balls should be spawned
+        self.wins = queue.SimpleQueue()  # Win amounts for the main thread to pay out
+        self.snapshot = Snapshot(0)
+
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self):
+        """True while the worker thread is alive"""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start ticking on a daemon thread, after any worker still stopping has finished"""
+        if self.running and not self.stop_event.is_set():
+            return
+        self.stop()  # Never let two workers share the simulation objects
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name='simulation', daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the worker and wait for it to finish its current tick. Returns True once it has.
+
+        With a timeout the worker may still be running when this returns False;
+        the thread is kept until it has exited, so start() waits for it too.
+        """
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            if self.thread.is_alive():
+                return False
+            self.thread = None
+        return True
+
+    def run(self):
+        """Worker loop: tick on schedule, publishing a snapshot after each round of ticks"""
+        tick = self.snapshot.tick
+        next_tick = time.perf_counter()
+        while not self.stop_event.is_set():
+            behind = 0
+            while time.perf_counter() >= next_tick and behind < self.max_ticks:
+                self.step()
+                tick += 1
+                next_tick += self.tick_seconds
+                behind += 1
+            if behind == self.max_ticks:
+                next_tick = time.perf_counter()  # Fell too far behind; slow down instead of spiralling
+            if behind:
+                self.publish(self.take_snapshot(tick))
+            self.stop_event.wait(max(0.0, next_tick - time.perf_counter()))
+
+    def publish(self, snapshot):
+        """Make a snapshot the one the render loop sees"""
+        self.snapshot = snapshot
+
+    def get_alpha(self, snapshot):
+        """Fraction of a tick elapsed since a snapshot was published, for interpolation"""
+        return min(1.0, (time.perf_counter() - snapshot.time) / self.tick_seconds)
+
+    def drain_drops(self):
+        """Get the bets queued for spawning since the last call (worker thread)"""
+        return drain_queue(self.drops)
+
+    def drain_wins(self):
+        """Get the win amounts reported since the last call (main thread)"""
+        return drain_queue(self.wins)
@@ -0,0 +1,31 @@
+import time
+
+class StartupTimeline:
+    """Times each phase of launching the game, up to the first frame on screen.
+
+    Call mark(name) as each phase finishes; a phase runs from the previous mark
+    (or from start) to its own.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []  # (name, milliseconds)
+
+    def mark(self, name):
+        """End the phase called name here"""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000))
+        self.last = now
+
+    @property
+    def total_ms(self):
+        """Milliseconds from start to the last mark"""
+        return (self.last - self.start) * 1000
+
+    def report(self):
+        """Format the phases as a table, one per line, ending with the total"""
+        width = max([len(name) for name, _ in self.phases] + [len('total')])
+        lines = [f"{name:<{width}} {ms:8.1f} ms" for name, ms in self.phases]
+        lines.append(f"{'total':<{width}} {self.total_ms:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,29 @@
+class FixedTimestep:
+    """Fixed-step accumulator that decouples simulation rate from frame rate"""
+
+    def __init__(self, tick_rate=60, max_ticks=5):
+        self.tick_ms = 1000.0 / tick_rate  # Length of one simulation tick
+        self.max_ticks = max_ticks  # Most ticks per frame before we drop time
+        self.accumulator = 0.0
+        self.alpha = 1.0  # Fraction of a tick between the last two states
+
+    def advance(self, elapsed_ms):
+        """Add elapsed frame time and return how many ticks to simulate"""
+        self.accumulator += elapsed_ms
+        ticks = int(self.accumulator // self.tick_ms)
+
+        # Avoid the spiral of death: if we fell too far behind, run the cap
+        # and drop the backlog so the game slows down instead of freezing
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self.accumulator %= self.tick_ms
+        else:
+            self.accumulator -= ticks * self.tick_ms
+
+        self.alpha = self.accumulator / self.tick_ms
+        return ticks
+
+    def reset(self):
+        """Forget accumulated time (e.g. after a long pause)"""
+        self.accumulator = 0.0
+        self.alpha = 1.0
@@ -1,40 +1,96 @@
+import time
+STARTED = time.perf_counter()  # Taken before the imports so the startup timeline covers them
+
 import pygame
 import sys
 from core.settings import SettingsManager
+from core.fonts import fonts
+from core.timestep import FixedTimestep
+from core.frame_governor import FrameGovernor
+from core.frame_budget import FrameBudget
+from core.screen_registry import ScreenRegistry
+from core.startup import StartupTimeline
+from core.event_dispatch import EventDispatcher
 from state.game_state import GameState
 from ui.menu_screen import MenuScreen
-from ui_components.game_screen import GameScreen
-from ui.shop_screen import ShopScreen
 
 class PlinkoGame:
     """Main game class that manages screens and game flow"""
     
-    def __init__(self):
-        # Initialize pygame
-        pygame.init()
+    def __init__(self, startup=None):
+        # Phases of launching are recorded here when profiling startup (see core.startup)
+        self.startup = startup
+        
+        # Initialize only the pygame subsystems we use (no audio or joysticks to open)
+        pygame.display.init()
+        pygame.font.init()
+        self.mark_startup('pygame init')
+        
+        # Load every font the screens use once, up front
+        fonts.preload()
+        self.mark_startup('fonts')
         
         # Initialize settings
         self.settings_manager = SettingsManager()
         self.width = self.settings_manager.get_setting('width')
         self.height = self.settings_manager.get_setting('height')
+        self.mark_startup('settings')
         
         # Create screen
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Plinko")
+        self.mark_startup('display')
         
-        # Set up the clock
+        # Set up the clock: render as fast as frame_rate allows, simulate at a fixed tick
         self.clock = pygame.time.Clock()
+        self.frame_rate = self.settings_manager.get_setting('frame_rate', 60)
+        self.timestep = FixedTimestep(tick_rate=60)
+        
+        # Drop the frame rate when nothing moves or the window is in the background
+        self.governor = FrameGovernor(
+            frame_rate=self.frame_rate,
+            idle_rate=self.settings_manager.get_setting('idle_frame_rate', 4),
+            background_rate=self.settings_manager.get_setting('background_frame_rate', 15)
+        )
+        
+        # Trade rendering quality for time when frames run over budget
+        self.frame_budget = FrameBudget(frame_rate=self.frame_rate)
+        
+        # Push only changed areas to the display on screens that support it
+        self.dirty_rects = self.settings_manager.get_setting('dirty_rects', False)
         
         # Initialize game state
         self.game_state = GameState()
+        self.mark_startup('game state')
+        
+        # Screens are built on first use and kept, so switching back is instant and
+        # the board keeps its balls. A new window size rebuilds them for the new layout.
+        self.screens = ScreenRegistry(layout_key=self.settings_manager.get_window_size)
+        self.screens.register('menu', self.create_menu)
+        self.screens.register('game', self.create_game)
+        self.screens.register('settings', self.create_settings)
+        self.screens.register('shop', self.create_shop)
+        self.screens.register('skins', self.create_skins)
+        
+        # Route input to the current screen, one coalesced batch per frame
+        self.dispatcher = EventDispatcher(lambda: self.current_screen, on_result=self.handle_result)
+        self.dispatcher.observers.append(self.governor.handle_event)
+        self.dispatcher.observers.append(self.handle_window_event)
+        self.dispatcher.register(pygame.QUIT, lambda event: self.stop())
         
         # Current screen
         self.current_screen = None
         self.show_menu()
+        self.mark_startup('first screen')
     
-    def show_menu(self):
-        """Show the main menu screen"""
-        self.current_screen = MenuScreen(
+    def mark_startup(self, phase):
+        """Record the end of a startup phase when profiling startup"""
+        if self.startup:
+            self.startup.mark(phase)
+    
+    def create_menu(self):
+        """Build the main menu screen"""
+        return MenuScreen(
             self.settings_manager,
             on_start=self.start_game,
             on_settings=self.show_settings,
@@ -42,34 +98,37 @@ class PlinkoGame:
             on_quit=self.quit_game,
             on_skins=self.show_skins
         )
-        
-    def start_game(self):
-        """Start the game"""
-        self.current_screen = GameScreen(
+    
+    def create_game(self):
+        """Build the game screen"""
+        # Screen modules are imported on first use to keep them off the startup path
+        from ui_components.game_screen import GameScreen
+        return GameScreen(
             self.settings_manager, 
             self.game_state,
             on_back=self.show_menu, 
             on_shop=self.show_shop
         )
     
-    def show_settings(self):
-        """Show settings screen"""
+    def create_settings(self):
+        """Build the settings screen"""
         from ui.settings_screen import SettingsScreen
-        self.current_screen = SettingsScreen(self.settings_manager, on_back=self.show_menu)
+        return SettingsScreen(self.settings_manager, on_back=self.show_menu)
     
-    def show_shop(self):
-        """Show shop screen"""
-        self.current_screen = ShopScreen(
+    def create_shop(self):
+        """Build the shop screen"""
+        from ui.shop_screen import ShopScreen
+        return ShopScreen(
             self.settings_manager, 
             on_back=self.show_menu, 
             coins=self.game_state.coins,
             purchased_skins=self.game_state.purchased_skins
         )
     
-    def show_skins(self):
-        """Show skins selection screen"""
+    def create_skins(self):
+        """Build the skins selection screen"""
         from ui.skins_screen import SkinsScreen
-        self.current_screen = SkinsScreen(
+        return SkinsScreen(
             self.settings_manager,
             on_back=self.show_menu,
             purchased_skins=self.game_state.purchased_skins,
@@ -77,75 +136,155 @@ class PlinkoGame:
             on_skin_selected=self.set_active_skin
         )
     
+    def show_screen(self, name, get_state=None):
+        """Switch to a registered screen and return it"""
+        self.current_screen = self.screens.show(name, get_state)
+        return self.current_screen
+    
+    def show_menu(self):
+        """Show the main menu screen"""
+        return self.show_screen('menu')
+        
+    def start_game(self):
+        """Start the game, or go back to the one in progress"""
+        return self.show_screen('game')
+    
+    def show_settings(self):
+        """Show settings screen"""
+        return self.show_screen('settings')
+    
+    def show_shop(self):
+        """Show shop screen"""
+        return self.show_screen('shop', lambda: {'coins': self.game_state.coins,
+                                                 'purchased_skins': self.game_state.purchased_skins})
+    
+    def show_skins(self):
+        """Show skins selection screen"""
+        return self.show_screen('skins', lambda: {'purchased_skins': self.game_state.purchased_skins,
+                                                  'active_skin': self.game_state.active_ball_skin})
+    
     def set_active_skin(self, skin_name):
         """Set the active ball skin"""
         self.game_state.set_active_skin(skin_name)
     
+    def handle_result(self, result):
+        """Act on what a screen's click handler returned"""
+        if not result or isinstance(result, bool):
+            return
+        
+        # Process shop purchases
+        if isinstance(result, dict):
+            # Handle coin purchases
+            if "add_coins" in result:
+                self.game_state.add_coins(result["add_coins"])
+                
+            # Handle item purchases
+            if "purchase_item" in result:
+                # Process the purchase in game state
+                if "effect" in result:
+                    if result["effect"] == "change_skin" and "skin" in result:
+                        # Purchase a new skin
+                        self.game_state.purchase_skin(result["skin"], result["cost"])
+                    elif result["effect"] == "lucky_charm" and "duration" in result:
+                        # Activate lucky charm
+                        self.game_state.subtract_coins(result["cost"])
+                        self.game_state.activate_lucky_charm(result["duration"])
+            
+            # Refresh the current screen with updated game state
+            if self.screens.current_name == 'shop':
+                self.current_screen.update_coins(self.game_state.coins)
+                self.current_screen.purchased_skins = self.game_state.purchased_skins
+        # If a screen object is returned, switch to it
+        elif hasattr(result, 'draw'):
+            self.current_screen = result
+    
+    def handle_window_event(self, event):
+        """Repaint everything after the window was hidden or covered, since its contents may be gone"""
+        if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            self.drawn_screen = None  # Next frame does a full draw and flip instead of dirty rects
+    
+    def stop(self):
+        """Leave the main loop after this frame"""
+        self.running = False
+    
     def quit_game(self):
         """Quit the game"""
         pygame.quit()
         sys.exit()
     
-    def run(self):
+    def run(self, exit_after_first_frame=False):
         """Main game loop"""
-        running = True
-        while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.MOUSEMOTION:
-                    if self.current_screen and hasattr(self.current_screen, 'update_hover_state'):
-                        self.current_screen.update_hover_state(event.pos)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.current_screen and hasattr(self.current_screen, 'handle_click'):
-                        result = self.current_screen.handle_click(event.pos)
-                        
-                        if result and not isinstance(result, bool):
-                            # Process shop purchases
-                            if isinstance(result, dict):
-                                # Handle coin purchases
-                                if "add_coins" in result:
-                                    self.game_state.add_coins(result["add_coins"])
-                                    
-                                # Handle item purchases
-                                if "purchase_item" in result:
-                                    # Process the purchase in game state
-                                    if "effect" in result:
-                                        if result["effect"] == "change_skin" and "skin" in result:
-                                            # Purchase a new skin
-                                            self.game_state.purchase_skin(result["skin"], result["cost"])
-                                        elif result["effect"] == "lucky_charm" and "duration" in result:
-                                            # Activate lucky charm
-                                            self.game_state.subtract_coins(result["cost"])
-                                            self.game_state.activate_lucky_charm(result["duration"])
-                                
-                                # Refresh the current screen with updated game state
-                                if isinstance(self.current_screen, ShopScreen):
-                                    self.current_screen.update_coins(self.game_state.coins)
-                                    self.current_screen.purchased_skins = self.game_state.purchased_skins
-                            # If a screen object is returned, switch to it
-                            elif hasattr(result, 'draw'):
-                                self.current_screen = result
+        self.running = True
+        self.drawn_screen = None  # Screen shown by the last frame
+        frame = 0
+        self.clock.tick()
+        while self.running:
+            # Wait for the next frame at the rate the governor picks, and measure how long it took.
+            # The first frame goes out right away.
+            self.governor.update(self.current_screen)
+            elapsed = self.governor.wait(self.clock) if frame else self.clock.tick()
+            ticks = self.timestep.advance(elapsed)
+            
+            # Handle events: motion is coalesced and everything is routed through the screen's handler table
+            event_ms = self.dispatcher.dispatch(self.governor.get_events())
             
-            # Update
+            # Update in fixed ticks so outcomes don't depend on frame rate
+            update_start = time.perf_counter()
             if self.current_screen and hasattr(self.current_screen, 'update'):
-                self.current_screen.update()
+                for _ in range(ticks):
+                    self.current_screen.update()
+            update_ms = (time.perf_counter() - update_start) * 1000 + event_ms  # The budget counts input too
+            
+            # Tell the screen how far between ticks we are for smooth drawing
+            if self.current_screen and hasattr(self.current_screen, 'interpolation'):
+                self.current_screen.interpolation = self.timestep.alpha
+            
+            # And how much detail the frame budget allows
+            if self.current_screen and hasattr(self.current_screen, 'quality'):
+                self.current_screen.quality = self.frame_budget.level
+            
+            # Nothing to draw while minimized, and only every other frame at the lowest quality
+            frame += 1
+            if not self.governor.should_draw or not self.frame_budget.should_draw(frame):
+                self.frame_budget.record(update_ms)
+                continue
             
-            # Render
-            self.screen.fill((0, 0, 0))  # Clear screen
-            if self.current_screen and hasattr(self.current_screen, 'draw'):
-                self.current_screen.draw(self.screen)
+            draw_start = time.perf_counter()
+            # Render only what changed when the screen supports it and was on screen last frame
+            dirty = None
+            if (self.dirty_rects and self.current_screen is self.drawn_screen
+                    and hasattr(self.current_screen, 'draw_dirty')):
+                dirty = self.current_screen.draw_dirty(self.screen)
+            else:
+                self.screen.fill((0, 0, 0))  # Clear screen
+                if self.current_screen and hasattr(self.current_screen, 'draw'):
+                    self.current_screen.draw(self.screen)
+            self.drawn_screen = self.current_screen
             
-            # Flip display
-            pygame.display.flip()
+            # Flip display, or push just the dirty areas
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            self.frame_budget.record(update_ms, (time.perf_counter() - draw_start) * 1000)
             
-            # Cap the frame rate
-            self.clock.tick(60)
+            # Report the startup timeline once the first frame is on screen
+            if self.startup:
+                self.mark_startup('first frame')
+                print(self.startup.report())
+                self.startup = None
+                if exit_after_first_frame:
+                    self.stop()
         
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = PlinkoGame()
-    game.run() 
\ No newline at end of file
+    # --profile-startup prints how long each phase of launching took;
+    # --exit-after-first-frame quits right after (see benchmarks/startup_bench.py)
+    startup = None
+    if '--profile-startup' in sys.argv:
+        startup = StartupTimeline(STARTED)
+        startup.mark('imports')
+    game = PlinkoGame(startup)
+    game.run(exit_after_first_frame='--exit-after-first-frame' in sys.argv) 
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""Ball-to-ball collision response with a sort-and-sweep broad phase"""
+import math
+
+def resolve_pair(a, b, restitution):
+    """Separate two overlapping balls and bounce them apart. Returns True on contact."""
+    dx = b.x - a.x
+    dy = b.y - a.y
+    min_distance = a.radius + b.radius
+    distance_sq = dx * dx + dy * dy
+    if distance_sq >= min_distance * min_distance:
+        return False
+
+    # Normal from a to b (pick an arbitrary one for exactly coincident balls)
+    distance = math.sqrt(distance_sq)
+    if distance > 0:
+        nx, ny = dx / distance, dy / distance
+    else:
+        nx, ny = 1.0, 0.0
+
+    # Push both balls out of overlap equally
+    push = (min_distance - distance) / 2
+    a.x -= nx * push
+    a.y -= ny * push
+    b.x += nx * push
+    b.y += ny * push
+
+    # Equal-mass impulse along the normal, only if they are approaching
+    approach = (b.dx - a.dx) * nx + (b.dy - a.dy) * ny
+    if approach < 0:
+        impulse = -(1 + restitution) * approach / 2
+        a.dx -= impulse * nx
+        a.dy -= impulse * ny
+        b.dx += impulse * nx
+        b.dy += impulse * ny
+    return True
+
+def resolve_ball_collisions(balls, restitution=0.8):
+    """Resolve every overlapping pair of balls and return how many contacts there were.
+
+    Balls are sorted by their left edge and swept left to right, so only balls
+    whose x extents overlap are tested; this stays near-linear while the balls
+    are spread across the board.
+    """
+    contacts = 0
+    active = []  # Balls whose x extent may still reach the current ball
+    for ball in sorted(balls, key=lambda b: b.x - b.radius):
+        left = ball.x - ball.radius
+        active = [other for other in active if other.x + other.radius > left]
+        for other in active:
+            if resolve_pair(other, ball, restitution):
+                contacts += 1
+        active.append(ball)
+    return contacts
@@ -1,10 +1,20 @@
 import random
 import math
 
+# Tunable constants that change the outcome distribution (shared with BatchBallPhysics)
+PHYSICS_CONSTANTS = ('gravity', 'bounce_damping', 'max_vertical_speed', 'collision_cooldown', 'elasticity',
+                     'max_step_distance')
+
 class BallPhysics:
     """Handles the physics calculations for balls in the Plinko game"""
     
-    def __init__(self):
+    def __init__(self, pin_index=None, rng=None):
+        # Optional spatial index over the pins (see physics.pin_index.PinGrid)
+        self.pin_index = pin_index
+        
+        # Random source (anything with uniform(), e.g. random.Random for reproducible runs)
+        self.rng = rng if rng is not None else random
+        
         # Physics constants
         self.gravity = 0.3  # Slightly reduced gravity for better control
         self.bounce_damping = 0.7  # More bouncy
@@ -12,67 +22,64 @@ class BallPhysics:
         self.collision_cooldown = 3
         self.elasticity = 0.75  # Elasticity of collisions
         
+        # Continuous collision: when set, a tick is split into sub-steps no longer
+        # than this so fast balls can't skip over a pin (see enable_continuous_collision)
+        self.max_step_distance = None
+        
+    def enable_continuous_collision(self, max_step_distance=5, max_vertical_speed=None):
+        """Sub-step fast balls instead of relying on the vertical speed cap to prevent tunneling"""
+        self.max_step_distance = max_step_distance
+        self.max_vertical_speed = max_vertical_speed
+        
+    def get_constants(self):
+        """Get the tunable physics constants as a dict"""
+        return {name: getattr(self, name) for name in PHYSICS_CONSTANTS}
+        
+    def set_constants(self, constants):
+        """Override tunable physics constants from a dict"""
+        for name, value in constants.items():
+            if name not in PHYSICS_CONSTANTS:
+                raise KeyError(f"Unknown physics constant: {name}")
+            setattr(self, name, value)
+        
     def update_position(self, ball, pin_positions, boundaries, pin_radius=5):
         """Update ball position and handle collisions with pins and boundaries"""
         # Store original state to check if a collision occurred
         collision_occurred = False
         
+        # Remember where the ball was for render interpolation
+        ball.prev_x = ball.x
+        ball.prev_y = ball.y
+        
         # Apply gravity with subtle randomness (simulates air resistance)
-        gravity_jitter = random.uniform(-0.02, 0.02)
+        gravity_jitter = self.rng.uniform(-0.02, 0.02)
         ball.dy += self.gravity + gravity_jitter
         
-        # Cap maximum vertical speed
-        if ball.dy > self.max_vertical_speed:
+        # Cap maximum vertical speed (None leaves it uncapped)
+        if self.max_vertical_speed is not None and ball.dy > self.max_vertical_speed:
             ball.dy = self.max_vertical_speed
         
         # Add subtle horizontal drag
         if abs(ball.dx) > 0.1:
             ball.dx *= 0.99
-            
-        # Calculate intended new position
-        intended_x = ball.x + ball.dx
-        intended_y = ball.y + ball.dy
         
-        # Check for pin collisions before moving
-        for pin_x, pin_y in pin_positions:
-            dx = intended_x - pin_x
-            dy = intended_y - pin_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            min_distance = ball.radius + pin_radius
-            
-            # Pre-emptive collision detection to prevent clipping
-            if distance < min_distance and ball.last_collision_time > self.collision_cooldown:
-                collision_occurred = True
-                ball.last_collision_time = 0
-                
-                # Calculate normal vector from pin to ball
-                nx = dx / max(distance, 0.1)  # Avoid division by zero
-                ny = dy / max(distance, 0.1)
-                
-                # Calculate impact velocity
-                impact_velocity = math.sqrt(ball.dx * ball.dx + ball.dy * ball.dy)
-                
-                # Move out of collision
-                overlap = min_distance - distance
-                intended_x += nx * overlap * 1.05  # Slightly higher to prevent sticking
-                intended_y += ny * overlap * 1.05
-                
-                # Calculate new velocities based on bounce
-                dot_product = ball.dx * nx + ball.dy * ny
-                ball.dx -= 2 * dot_product * nx * self.bounce_damping
-                ball.dy -= 2 * dot_product * ny * self.bounce_damping
-                
-                # Add impact-based random deflection (harder impacts have more randomness)
-                deflection_scale = min(0.3, impact_velocity * 0.04)
-                random_deflection = random.uniform(-deflection_scale, deflection_scale)
-                ball.dx += random_deflection
-                
-                # Add visual feedback for collisions
-                ball.collision_flash = 10  # Frames of collision visual feedback
+        # Split fast moves into sub-steps no longer than max_step_distance so the
+        # ball can't pass a pin between two checks
+        substeps = 1
+        if self.max_step_distance:
+            travel = math.sqrt(ball.dx * ball.dx + ball.dy * ball.dy)
+            substeps = max(1, math.ceil(travel / self.max_step_distance))
+        
+        # Move and check for pin collisions before each (sub-)step lands
+        x, y = ball.x, ball.y
+        for _ in range(substeps):
+            x, y, hit = self.collide_with_pins(ball, x + ball.dx / substeps, y + ball.dy / substeps,
+                                               pin_positions, pin_radius)
+            collision_occurred = collision_occurred or hit
         
         # Update ball position
-        ball.x = intended_x
-        ball.y = intended_y
+        ball.x = x
+        ball.y = y
         
         # Apply extremely subtle center bias (increases with distance from center)
         center_x = (boundaries['left'] + boundaries['right']) / 2
@@ -98,14 +105,68 @@ class BallPhysics:
             ball.collision_flash = 5  # Shorter flash for wall collisions
             
         # Add a tiny amount of randomness for natural-looking motion
-        ball.dx += random.uniform(-0.01, 0.01)
+        ball.dx += self.rng.uniform(-0.01, 0.01)
         
         # Update collision cooldown
         if not collision_occurred:
             ball.last_collision_time += 1
             
         # Update collision flash (for visual feedback)
-        if hasattr(ball, 'collision_flash') and ball.collision_flash > 0:
+        if ball.collision_flash > 0:
             ball.collision_flash -= 1
             
-        return collision_occurred 
\ No newline at end of file
+        return collision_occurred
+        
+    def collide_with_pins(self, ball, intended_x, intended_y, pin_positions, pin_radius):
+        """Bounce the ball off any pin at its intended position.
+        
+        Returns the corrected (x, y) and whether a pin was hit.
+        """
+        collision_occurred = False
+        
+        # Only the pins near the ball can collide, so ask the index when we have one
+        min_distance = ball.radius + pin_radius
+        candidates = None
+        if self.pin_index is not None:
+            candidates = self.pin_index.nearby(intended_x, intended_y, min_distance)
+        if candidates is None:
+            candidates = pin_positions
+        
+        # Check for pin collisions before moving
+        for pin in candidates:
+            pin_x, pin_y = pin
+            dx = intended_x - pin_x
+            dy = intended_y - pin_y
+            distance = math.sqrt(dx * dx + dy * dy)
+            
+            # Pre-emptive collision detection to prevent clipping
+            if distance < min_distance and ball.last_collision_time > self.collision_cooldown:
+                collision_occurred = True
+                ball.last_collision_time = 0
+                
+                # Calculate normal vector from pin to ball
+                nx = dx / max(distance, 0.1)  # Avoid division by zero
+                ny = dy / max(distance, 0.1)
+                
+                # Calculate impact velocity
+                impact_velocity = math.sqrt(ball.dx * ball.dx + ball.dy * ball.dy)
+                
+                # Move out of collision
+                overlap = min_distance - distance
+                intended_x += nx * overlap * 1.05  # Slightly higher to prevent sticking
+                intended_y += ny * overlap * 1.05
+                
+                # Calculate new velocities based on bounce
+                dot_product = ball.dx * nx + ball.dy * ny
+                ball.dx -= 2 * dot_product * nx * self.bounce_damping
+                ball.dy -= 2 * dot_product * ny * self.bounce_damping
+                
+                # Add impact-based random deflection (harder impacts have more randomness)
+                deflection_scale = min(0.3, impact_velocity * 0.04)
+                random_deflection = self.rng.uniform(-deflection_scale, deflection_scale)
+                ball.dx += random_deflection
+                
+                # Add visual feedback for collisions
+                ball.collision_flash = 10  # Frames of collision visual feedback
+                
+        return intended_x, intended_y, collision_occurred 
\ No newline at end of file
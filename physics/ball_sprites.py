@@ -0,0 +1,104 @@
+"""Pre-rendered ball sprites, drawn in one batched blit per frame"""
+import pygame
+
+from physics.game_objects import draw_ball
+
+# Flash values at or above this all draw the same (the glow alpha caps at 150)
+MAX_FLASH = 10
+
+# Fixed set of rainbow skin colours, so every rainbow ball has a cached sprite
+RAINBOW_PALETTE = [
+    (255, 150, 150), (255, 190, 150), (255, 230, 150), (230, 255, 150),
+    (170, 255, 160), (150, 255, 210), (150, 240, 255), (150, 190, 255),
+    (180, 150, 255), (220, 150, 255), (255, 150, 230), (255, 255, 255),
+]
+
+class BallSprites:
+    """Cache of composed ball images keyed by colour, radius and flash level"""
+
+    def __init__(self):
+        self.sprites = {}
+
+    def get(self, color, radius, collision_flash=0):
+        """Get the sprite for a ball, rendering it the first time it is needed.
+
+        collision_flash None gets a sprite cropped to the ball, without room for the glow.
+        """
+        if collision_flash is not None:
+            collision_flash = min(int(collision_flash), MAX_FLASH)
+        key = (color, radius, collision_flash)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = self.render(*key)
+        return sprite
+
+    @staticmethod
+    def render(color, radius, collision_flash):
+        """Draw a ball onto its own transparent surface, centred like ball_rect"""
+        reach = get_reach(radius, collision_flash is not None)
+        sprite = pygame.Surface((reach * 2 + 1, reach * 2 + 1), pygame.SRCALPHA)
+        draw_ball(sprite, reach, reach, radius, color, collision_flash or 0)
+        if pygame.display.get_surface():
+            sprite = sprite.convert_alpha()  # Match the display format for fast blits
+        return sprite
+
+    def preload(self, colors, radius):
+        """Render every flash level of some colours up front"""
+        for color in colors:
+            for collision_flash in range(MAX_FLASH + 1):
+                self.get(color, radius, collision_flash)
+
+    def get_blits(self, balls, alpha=1.0, glow=True):
+        """Get (sprite, position) pairs for balls, interpolated alpha of the way from their previous tick.
+
+        glow False draws every ball unflashed from smaller sprites.
+        """
+        blits = []
+        for ball in balls:
+            x = ball.prev_x + (ball.x - ball.prev_x) * alpha
+            y = ball.prev_y + (ball.y - ball.prev_y) * alpha
+            reach = get_reach(ball.radius, glow)
+            blits.append((self.get(ball.color, ball.radius, ball.collision_flash if glow else None),
+                          (int(x) - reach, int(y) - reach)))
+        return blits
+
+    def get_batch_blits(self, engine, alpha=1.0, glow=True):
+        """Get (sprite, position) pairs for every ball in a BatchBallPhysics"""
+        n = engine.count
+        x = (engine.prev_x[:n] + (engine.x[:n] - engine.prev_x[:n]) * alpha).astype(int)
+        y = (engine.prev_y[:n] + (engine.y[:n] - engine.prev_y[:n]) * alpha).astype(int)
+        blits = []
+        for i in range(n):
+            radius = float(engine.radius[i])
+            reach = get_reach(radius, glow)
+            blits.append((self.get(engine.colors[i], radius, engine.collision_flash[i] if glow else None),
+                          (int(x[i]) - reach, int(y[i]) - reach)))
+        return blits
+
+def get_reach(radius, glow=True):
+    """Distance from a ball's centre to the edge of its sprite"""
+    return int(radius) + (5 if glow else 1)
+
+def draw_plain_balls(screen, balls, alpha=1.0):
+    """Draw balls as single flat circles (cheapest look). alpha None skips interpolation."""
+    circle = pygame.draw.circle
+    if alpha is None:
+        for ball in balls:
+            circle(screen, ball.color, (int(ball.x), int(ball.y)), ball.radius)
+        return
+    for ball in balls:
+        circle(screen, ball.color, (int(ball.prev_x + (ball.x - ball.prev_x) * alpha),
+                                    int(ball.prev_y + (ball.y - ball.prev_y) * alpha)), ball.radius)
+
+def draw_plain_batch(screen, engine, alpha=1.0):
+    """Draw every ball of a BatchBallPhysics as flat circles. alpha None skips interpolation."""
+    n = engine.count
+    if alpha is None:
+        x, y = engine.x[:n], engine.y[:n]
+    else:
+        x = engine.prev_x[:n] + (engine.x[:n] - engine.prev_x[:n]) * alpha
+        y = engine.prev_y[:n] + (engine.y[:n] - engine.prev_y[:n]) * alpha
+    circle = pygame.draw.circle
+    for color, cx, cy, radius in zip(engine.colors, x.astype(int).tolist(), y.astype(int).tolist(),
+                                     engine.radius[:n].tolist()):
+        circle(screen, color, (cx, cy), radius)
@@ -0,0 +1,356 @@
+"""Vectorized physics engine that steps every live ball at once"""
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; GameScreen falls back to BallPhysics without it
+    np = None
+
+from physics.ball_physics import BallPhysics
+
+class BatchBallPhysics:
+    """Structure-of-arrays ball engine mirroring BallPhysics, stepped with NumPy"""
+
+    def __init__(self, capacity=256, rng=None):
+        if np is None:
+            raise ImportError("BatchBallPhysics requires numpy")
+
+        # Physics constants (same values as BallPhysics)
+        self.gravity = 0.3
+        self.bounce_damping = 0.7
+        self.max_vertical_speed = 5.5
+        self.collision_cooldown = 3
+        self.elasticity = 0.75
+        self.max_step_distance = None  # Sub-step length for continuous collision
+
+        # Random source for jitter and deflection
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Live ball storage, one slot per ball in [0, count)
+        self.count = 0
+        self.capacity = 0
+        self.colors = []  # Python list, kept aligned with the arrays
+        self.allocate(capacity)
+
+        # Pin data, set by set_pins
+        self.pin_x = np.zeros(0)
+        self.pin_y = np.zeros(0)
+        self.cell_size = None
+        self.cell_table = None
+
+        # Cached multiplier zone bounds, rebuilt when the rect list changes
+        self.zone_rects = None
+        self.zone_bounds = None
+
+    # Same constant helpers as the scalar engine
+    get_constants = BallPhysics.get_constants
+    set_constants = BallPhysics.set_constants
+    enable_continuous_collision = BallPhysics.enable_continuous_collision
+
+    @staticmethod
+    def available():
+        """Check whether NumPy is installed so the engine can be used"""
+        return np is not None
+
+    def allocate(self, capacity):
+        """Grow the ball arrays to hold at least capacity balls"""
+        capacity = max(capacity, 1)
+        old = self.count
+
+        def grow(name, dtype):
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            setattr(self, name, array)
+
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'dx', 'dy', 'radius', 'bet_amount'):
+            grow(name, np.float64)
+        for name in ('last_collision_time', 'collision_flash', 'age'):
+            grow(name, np.int32)
+        self.capacity = capacity
+
+    def set_pins(self, pin_positions, pin_index=None):
+        """Load the pin layout, using a PinGrid's neighbourhoods when one is given"""
+        pins = np.asarray(pin_positions, dtype=np.float64).reshape(-1, 2)
+        self.pin_x = pins[:, 0].copy()
+        self.pin_y = pins[:, 1].copy()
+        self.cell_size = None
+        self.cell_table = None
+
+        if pin_index is None or not pin_index.cells:
+            return
+
+        # Flatten the index into a dense table of pin ids (padded with -1) so a
+        # whole population can look up its candidate pins in one gather
+        order = {position: i for i, position in reversed(list(enumerate(pin_index.pin_positions)))}
+        cells = pin_index.cells
+        min_cx = min(cx for cx, _ in cells)
+        min_cy = min(cy for _, cy in cells)
+        width = max(cx for cx, _ in cells) - min_cx + 1
+        height = max(cy for _, cy in cells) - min_cy + 1
+        depth = max(len(candidates) for candidates in cells.values())
+
+        table = np.full((width * height + 1, depth), -1, dtype=np.int64)  # Last row stays empty
+        for (cx, cy), candidates in cells.items():
+            ids = [order[position] for position in candidates]
+            table[(cx - min_cx) * height + (cy - min_cy), :len(ids)] = ids
+
+        self.cell_size = pin_index.cell_size
+        self.cell_origin = (min_cx, min_cy)
+        self.cell_shape = (width, height)
+        self.cell_reach = pin_index.reach
+        self.cell_table = table
+
+    def add_ball(self, x, y, dx, dy, radius, color, bet_amount):
+        """Add a ball to the simulation"""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.radius[i] = radius
+        self.bet_amount[i] = bet_amount
+        self.last_collision_time[i] = 0
+        self.collision_flash[i] = 0
+        self.age[i] = 0
+        self.colors.append(color)
+        self.count += 1
+
+    def candidate_pins(self, x, y, min_distance):
+        """Get an (n, k) array of candidate pin ids per ball, padded with -1"""
+        n = len(x)
+        if self.cell_table is None or np.max(min_distance) > self.cell_reach:
+            # No usable index: every ball tests every pin, like the brute-force scan
+            return np.broadcast_to(np.arange(len(self.pin_x)), (n, len(self.pin_x)))
+
+        width, height = self.cell_shape
+        cx = np.floor(x / self.cell_size).astype(np.int64) - self.cell_origin[0]
+        cy = np.floor(y / self.cell_size).astype(np.int64) - self.cell_origin[1]
+        inside = (cx >= 0) & (cx < width) & (cy >= 0) & (cy < height)
+        rows = np.where(inside, cx * height + cy, width * height)
+        return self.cell_table[rows]
+
+    def step(self, boundaries, pin_radius=5):
+        """Advance every live ball by one physics tick"""
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        dx, dy = self.dx[:n], self.dy[:n]
+        radius = self.radius[:n]
+        cooldown = self.last_collision_time[:n]
+        flash = self.collision_flash[:n]
+        rng = self.rng
+
+        # Remember where the balls were for render interpolation
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        # Gravity with jitter, speed cap and horizontal drag
+        dy += self.gravity + rng.uniform(-0.02, 0.02, n)
+        if self.max_vertical_speed is not None:
+            np.minimum(dy, self.max_vertical_speed, out=dy)
+        dx[np.abs(dx) > 0.1] *= 0.99
+
+        # Sub-step the fastest ball's move so no ball skips over a pin
+        substeps = 1
+        if self.max_step_distance:
+            travel = np.sqrt(dx * dx + dy * dy).max()
+            substeps = max(1, int(np.ceil(travel / self.max_step_distance)))
+
+        collided = np.zeros(n, dtype=bool)
+        intended_x = x.copy()
+        intended_y = y.copy()
+        for _ in range(substeps):
+            intended_x += dx / substeps
+            intended_y += dy / substeps
+            self.collide_with_pins(intended_x, intended_y, collided, pin_radius)
+
+        x[:] = intended_x
+        y[:] = intended_y
+
+        # Subtle center bias, stronger further from center
+        center_x = (boundaries['left'] + boundaries['right']) / 2
+        distance_from_center = x - center_x
+        distance_factor = np.minimum(1.0, np.abs(distance_from_center) / 100)
+        dx -= distance_from_center * 0.0004 * distance_factor
+
+        # Wall bounces
+        left = x - radius < boundaries['left']
+        right = ~left & (x + radius > boundaries['right'])
+        x[left] = boundaries['left'] + radius[left]
+        dx[left] = np.abs(dx[left]) * self.elasticity
+        x[right] = boundaries['right'] - radius[right]
+        dx[right] = -np.abs(dx[right]) * self.elasticity
+        walls = left | right
+        flash[walls] = 5
+        collided |= walls
+
+        # Tiny randomness for natural-looking motion
+        dx += rng.uniform(-0.01, 0.01, n)
+
+        # Cooldown and flash bookkeeping
+        cooldown[~collided] += 1
+        flash[flash > 0] -= 1
+        self.age[:n] += 1
+
+    def collide_with_pins(self, intended_x, intended_y, collided, pin_radius):
+        """Bounce balls off pins at their intended positions, updating them in place.
+
+        The first overlapping candidate (in pin order) wins, as in BallPhysics.
+        """
+        n = self.count
+        if not len(self.pin_x):
+            return
+
+        dx, dy = self.dx[:n], self.dy[:n]
+        radius = self.radius[:n]
+        cooldown = self.last_collision_time[:n]
+        flash = self.collision_flash[:n]
+
+        min_distance = radius + pin_radius
+        candidates = self.candidate_pins(intended_x, intended_y, min_distance)
+        valid = candidates >= 0
+        safe = np.where(valid, candidates, 0)
+        offset_x = intended_x[:, None] - self.pin_x[safe]
+        offset_y = intended_y[:, None] - self.pin_y[safe]
+        distance = np.sqrt(offset_x * offset_x + offset_y * offset_y)
+
+        ready = (cooldown > self.collision_cooldown)[:, None]
+        overlapping = valid & (distance < min_distance[:, None]) & ready
+
+        rows = np.flatnonzero(overlapping.any(axis=1))
+        if not len(rows):
+            return
+        first = overlapping[rows].argmax(axis=1)
+        hit_distance = distance[rows, first]
+        nx = offset_x[rows, first] / np.maximum(hit_distance, 0.1)
+        ny = offset_y[rows, first] / np.maximum(hit_distance, 0.1)
+
+        ball_dx, ball_dy = dx[rows], dy[rows]
+        impact_velocity = np.sqrt(ball_dx * ball_dx + ball_dy * ball_dy)
+
+        # Move out of collision
+        overlap = min_distance[rows] - hit_distance
+        intended_x[rows] += nx * overlap * 1.05
+        intended_y[rows] += ny * overlap * 1.05
+
+        # Bounce with impact-scaled random deflection
+        dot_product = ball_dx * nx + ball_dy * ny
+        ball_dx = ball_dx - 2 * dot_product * nx * self.bounce_damping
+        ball_dy = ball_dy - 2 * dot_product * ny * self.bounce_damping
+        deflection_scale = np.minimum(0.3, impact_velocity * 0.04)
+        dx[rows] = ball_dx + self.rng.uniform(-deflection_scale, deflection_scale)
+        dy[rows] = ball_dy
+
+        collided[rows] = True
+        cooldown[rows] = 0
+        flash[rows] = 10
+
+    def resolve_ball_collisions(self, restitution=0.8):
+        """Resolve ball-to-ball contacts and return how many there were.
+
+        Vectorized sort-and-sweep: balls are sorted by x, then each pass k tests
+        every ball against the one k places to its right, stopping once no pair
+        at that distance in the order can overlap horizontally.
+        """
+        n = self.count
+        if n < 2:
+            return 0
+
+        order = np.argsort(self.x[:n], kind='stable')
+        sx = self.x[:n][order]
+        reach = 2 * self.radius[:n].max()
+        contacts = 0
+        for k in range(1, n):
+            close = (sx[k:] - sx[:-k]) < reach
+            if not close.any():
+                break
+            left = order[:-k][close]
+            right = order[k:][close]
+
+            dx = self.x[right] - self.x[left]
+            dy = self.y[right] - self.y[left]
+            min_distance = self.radius[left] + self.radius[right]
+            distance = np.sqrt(dx * dx + dy * dy)
+            touching = distance < min_distance
+            if not touching.any():
+                continue
+
+            left, right = left[touching], right[touching]
+            dx, dy = dx[touching], dy[touching]
+            distance, min_distance = distance[touching], min_distance[touching]
+            safe = np.where(distance > 0, distance, 1.0)
+            nx = np.where(distance > 0, dx / safe, 1.0)
+            ny = np.where(distance > 0, dy / safe, 0.0)
+
+            # Push both balls out of overlap equally
+            push = (min_distance - distance) / 2
+            np.add.at(self.x, left, -nx * push)
+            np.add.at(self.y, left, -ny * push)
+            np.add.at(self.x, right, nx * push)
+            np.add.at(self.y, right, ny * push)
+
+            # Equal-mass impulse along the normal for approaching pairs
+            approach = (self.dx[right] - self.dx[left]) * nx + (self.dy[right] - self.dy[left]) * ny
+            impulse = np.where(approach < 0, -(1 + restitution) * approach / 2, 0.0)
+            np.add.at(self.dx, left, -impulse * nx)
+            np.add.at(self.dy, left, -impulse * ny)
+            np.add.at(self.dx, right, impulse * nx)
+            np.add.at(self.dy, right, impulse * ny)
+            contacts += len(left)
+        return contacts
+
+    def settle(self, multipliers, multiplier_rects, bottom_boundary, max_ticks=None):
+        """Retire balls that reached a multiplier zone or left the board.
+
+        With max_ticks, balls that have been stepped that many times without
+        landing are retired as lost too (like MAX_TICKS_PER_BALL in the scalar
+        simulation). Returns a list of (bet_amount, zone_index) tuples, with
+        zone_index None for lost balls.
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        if self.zone_rects is not multiplier_rects:
+            self.zone_rects = multiplier_rects
+            self.zone_bounds = np.array([(r.left, r.top, r.right, r.bottom) for r in multiplier_rects],
+                                        dtype=np.float64).reshape(-1, 4)
+
+        # Rect.collidepoint truncates coordinates to integers
+        px = np.trunc(self.x[:n])[:, None]
+        py = np.trunc(self.y[:n])[:, None]
+        bounds = self.zone_bounds
+        inside = (px >= bounds[:, 0]) & (px < bounds[:, 2]) & (py >= bounds[:, 1]) & (py < bounds[:, 3])
+        landed = inside.any(axis=1)
+        zone = inside.argmax(axis=1)
+        lost = ~landed & (self.y[:n] > bottom_boundary)
+        if max_ticks is not None:
+            lost |= ~landed & (self.age[:n] >= max_ticks)  # Stuck or trapped
+        done = landed | lost
+        if not done.any():
+            return []
+
+        settled = [(float(self.bet_amount[i]), int(zone[i]) if landed[i] else None)
+                   for i in np.flatnonzero(done)]
+        self.compact(~done)
+        return settled
+
+    def compact(self, keep):
+        """Drop the balls whose keep flag is False, preserving order"""
+        n = self.count
+        kept = int(keep.sum())
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'dx', 'dy', 'radius', 'bet_amount',
+                     'last_collision_time', 'collision_flash', 'age'):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.colors = [color for color, k in zip(self.colors, keep) if k]
+        self.count = kept
+
+    def clear(self):
+        """Remove every ball"""
+        self.count = 0
+        self.colors = []
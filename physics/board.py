@@ -0,0 +1,67 @@
+"""Board layout shared by the game screen and headless tools"""
+import pygame
+
+# Layout constants
+PIN_RADIUS = 5
+PIN_ROWS = 16
+START_Y = 100  # Y position of the first pin row
+VERTICAL_SPACING = 30  # Space between rows
+HORIZONTAL_SPACING = 30  # Space between pins in the same row
+
+# Ball spawn constants (see GameScreen.drop_ball)
+BALL_RADIUS = 9.5
+BALL_START_Y = 70
+
+# Default payout table, from the left edge to the right edge
+MULTIPLIERS = [110, 41, 10, 5, 3, 2, 1.5, 1, 0.5, 0.3, 0.5, 1, 1.5, 2, 3, 5, 10, 41, 110]
+
+def zone_count(rows=PIN_ROWS):
+    """Number of landing zones under a board with this many pin rows (one payout each)"""
+    return rows + 3
+
+def create_pin_positions(width, rows=PIN_ROWS):
+    """Get the (x, y) position of every pin, row by row"""
+    positions = []
+    for row in range(rows):
+        # First row has 3 pins, each row adds one more
+        pins_in_row = row + 3
+
+        # Center the row in the window
+        row_width = (pins_in_row - 1) * HORIZONTAL_SPACING
+        row_start_x = (width - row_width) // 2
+
+        for pin in range(pins_in_row):
+            positions.append((row_start_x + pin * HORIZONTAL_SPACING, START_Y + row * VERTICAL_SPACING))
+    return positions
+
+def create_multiplier_rects(width, count, rows=PIN_ROWS):
+    """Get the landing zone rect for each multiplier below the last pin row"""
+    # Position below the last row of pins
+    multiplier_y = START_Y + ((rows - 1) * VERTICAL_SPACING) - 15
+    last_row_x = (width - (rows * HORIZONTAL_SPACING)) // 2 - 16
+
+    multiplier_width = 26
+    multiplier_height = 35
+
+    # Adjust spacing if needed to fit within window
+    horizontal_spacing = HORIZONTAL_SPACING
+    total_width_needed = multiplier_width * count
+    available_width = width - 40  # Leave some margin
+    if total_width_needed > available_width:
+        horizontal_spacing = max(20, (available_width - multiplier_width) / (count - 1))
+
+    rects = []
+    for i in range(count):
+        x = last_row_x + (i * horizontal_spacing)
+        rects.append(pygame.Rect(x - (multiplier_width // 2), multiplier_y,
+                                 multiplier_width, multiplier_height))
+    return rects
+
+def create_boundaries(width, height, rows=PIN_ROWS):
+    """Get the side walls and floor the balls bounce between"""
+    left = (width - (rows * HORIZONTAL_SPACING)) // 2 - 20
+    return {
+        'left': left,
+        'right': width - left,
+        'bottom': height
+    }
@@ -1,13 +1,81 @@
 import pygame
 import random
 
+def ball_rect(x, y, radius):
+    """Get the screen area draw_ball touches for a ball at (x, y), flash glow included"""
+    reach = int(radius) + 5
+    return pygame.Rect(int(x) - reach, int(y) - reach, reach * 2 + 1, reach * 2 + 1)
+
+def ball_rects(prev_x, prev_y, x, y, radius, alpha=1.0):
+    """Get ball_rect for each ball in parallel position arrays, interpolated alpha of the way from prev"""
+    x = prev_x + (x - prev_x) * alpha
+    y = prev_y + (y - prev_y) * alpha
+    return [ball_rect(bx, by, r) for bx, by, r in zip(x, y, radius)]
+
+def draw_ball(screen, x, y, radius, color, collision_flash=0):
+    """Draw a ball at the given position (BallSprites renders its sprites with this)"""
+    # Determine if we should show collision flash
+    flash_active = collision_flash > 0
+    
+    # Draw outer circle with glow effect if flashing
+    if flash_active:
+        # Add a subtle glow for impact
+        glow_radius = radius + 3
+        glow_alpha = min(150, collision_flash * 15)
+        glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
+        glow_color = (255, 255, 200, glow_alpha)
+        pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
+        screen.blit(glow_surface, (int(x - glow_radius), int(y - glow_radius)))
+    
+    # Draw outer circle
+    pygame.draw.circle(screen, color, (int(x), int(y)), radius)
+    
+    # Create inner color (slightly darker version of the ball color)
+    inner_color = color
+    
+    # For gold colors, make inner color slightly darker
+    if color == (255, 215, 0):  # If it's gold
+        inner_color = (200, 170, 0)
+    elif isinstance(color, tuple) and len(color) == 3:
+        # For other colors, create a slightly darker shade
+        r = max(0, color[0] - 40)
+        g = max(0, color[1] - 40)
+        b = max(0, color[2] - 40)
+        inner_color = (r, g, b)
+        
+    # Draw inner circle for 3D effect
+    pygame.draw.circle(screen, inner_color, (int(x), int(y)), radius - 2)
+    
+    # Add highlight for more realistic look
+    highlight_pos = (int(x - radius * 0.3), int(y - radius * 0.3))
+    highlight_radius = int(radius * 0.4)
+    highlight_color = (255, 255, 255, 50)  # Semi-transparent white
+    
+    # Create a surface for the semi-transparent highlight
+    highlight_surface = pygame.Surface((highlight_radius*2, highlight_radius*2), pygame.SRCALPHA)
+    pygame.draw.circle(highlight_surface, highlight_color, (highlight_radius, highlight_radius), highlight_radius)
+    
+    # Blit the highlight onto the screen
+    screen.blit(highlight_surface, (highlight_pos[0] - highlight_radius, highlight_pos[1] - highlight_radius))
+
+
 class Ball:
     """Ball object that bounces through the pins"""
     
+    # Fixed attribute layout: no per-ball __dict__, and every ball has every field
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'radius', 'color', 'dx', 'dy',
+                 'bet_amount', 'active', 'last_collision_time', 'collision_flash')
+    
     def __init__(self, x, y, radius, color, bet_amount):
+        self.reset(x, y, radius, color, bet_amount)
+        
+    def reset(self, x, y, radius, color, bet_amount):
+        """(Re)initialize every field so a pooled ball can be reused"""
         # Position and size
         self.x = x
         self.y = y
+        self.prev_x = x  # Position at the previous tick, for render interpolation
+        self.prev_y = y
         self.radius = radius
         
         # Appearance
@@ -23,52 +91,6 @@ class Ball:
         self.last_collision_time = 0  # For collision cooldown
         self.collision_flash = 0  # For visual collision feedback
 
-    def draw(self, screen):
-        """Draw the ball on the screen"""
-        # Determine if we should show collision flash
-        flash_active = hasattr(self, 'collision_flash') and self.collision_flash > 0
-        
-        # Draw outer circle with glow effect if flashing
-        if flash_active:
-            # Add a subtle glow for impact
-            glow_radius = self.radius + 3
-            glow_alpha = min(150, self.collision_flash * 15)
-            glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-            glow_color = (255, 255, 200, glow_alpha)
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow_surface, (int(self.x - glow_radius), int(self.y - glow_radius)))
-        
-        # Draw outer circle
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        
-        # Create inner color (slightly darker version of the ball color)
-        inner_color = self.color
-        
-        # For gold colors, make inner color slightly darker
-        if self.color == (255, 215, 0):  # If it's gold
-            inner_color = (200, 170, 0)
-        elif isinstance(self.color, tuple) and len(self.color) == 3:
-            # For other colors, create a slightly darker shade
-            r = max(0, self.color[0] - 40)
-            g = max(0, self.color[1] - 40)
-            b = max(0, self.color[2] - 40)
-            inner_color = (r, g, b)
-            
-        # Draw inner circle for 3D effect
-        pygame.draw.circle(screen, inner_color, (int(self.x), int(self.y)), self.radius - 2)
-        
-        # Add highlight for more realistic look
-        highlight_pos = (int(self.x - self.radius * 0.3), int(self.y - self.radius * 0.3))
-        highlight_radius = int(self.radius * 0.4)
-        highlight_color = (255, 255, 255, 50)  # Semi-transparent white
-        
-        # Create a surface for the semi-transparent highlight
-        highlight_surface = pygame.Surface((highlight_radius*2, highlight_radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(highlight_surface, highlight_color, (highlight_radius, highlight_radius), highlight_radius)
-        
-        # Blit the highlight onto the screen
-        screen.blit(highlight_surface, (highlight_pos[0] - highlight_radius, highlight_pos[1] - highlight_radius))
-
     def check_multiplier_collision(self, multipliers, multiplier_rects, on_win_callback):
         """Check if ball has reached a multiplier zone and trigger win callback"""
         if not self.active:
@@ -88,6 +110,25 @@ class Ball:
         return self.y > bottom_boundary
 
 
+class BallPool:
+    """Free list of retired balls so sustained dropping doesn't churn allocations"""
+    
+    def __init__(self):
+        self.free = []
+        
+    def acquire(self, x, y, radius, color, bet_amount):
+        """Get a ball, reusing a retired one when available"""
+        if self.free:
+            ball = self.free.pop()
+            ball.reset(x, y, radius, color, bet_amount)
+            return ball
+        return Ball(x, y, radius, color, bet_amount)
+        
+    def release(self, ball):
+        """Return a retired ball to the pool"""
+        self.free.append(ball)
+
+
 class Pin:
     """Pin object that balls bounce off of"""
     
@@ -0,0 +1,120 @@
+"""Persistent cache of landing-zone probability tables"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from physics.ball_physics import BallPhysics
+
+def make_key(pin_positions, multiplier_rects, multipliers, constants, engine=None):
+    """Hash a board layout, physics constants and (optionally) engine name into a cache key"""
+    description = {
+        'pins': [list(position) for position in pin_positions],
+        'zones': [[rect.left, rect.top, rect.width, rect.height] for rect in multiplier_rects],
+        'multipliers': list(multipliers),
+        'physics': dict(sorted(constants.items())),
+    }
+    if engine is not None:
+        description['engine'] = engine  # The engines integrate differently, so their tables can differ
+    encoded = json.dumps(description, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+class OutcomeCache:
+    """On-disk LRU cache of outcome distributions keyed by board and physics parameters"""
+
+    def __init__(self, path='outcome_cache.json', max_entries=64):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = self.load()
+        self.dirty = False  # Recency changed in memory since the last save
+
+    def load(self):
+        """Load cached entries from file, oldest first"""
+        try:
+            with open(self.path, 'r') as f:
+                return OrderedDict(json.load(f))
+        except (FileNotFoundError, ValueError):
+            return OrderedDict()
+
+    def save(self):
+        """Write entries to file atomically"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def flush(self):
+        """Save if lookups reordered entries since the last save"""
+        if self.dirty:
+            self.save()
+
+    def get(self, key):
+        """Get the cached entry for a key, or None if it was never computed"""
+        entry = self.entries.get(key)
+        if entry is not None and next(reversed(self.entries)) != key:
+            # Mark as most recently used; written out by the next put() or flush()
+            self.entries.move_to_end(key)
+            self.dirty = True
+        return entry
+
+    def put(self, key, result):
+        """Store a SimulationResult's distribution, evicting the least recently used"""
+        low, high = result.rtp_interval()
+        self.entries[key] = {
+            'balls': result.total,
+            'counts': result.counts,  # Raw counts, so a later, larger request can top the entry up
+            'lost_balls': result.lost,
+            'multipliers': result.multipliers,
+            'probabilities': result.probabilities(),
+            'lost': result.lost / result.total if result.total else 0.0,
+            'expected_value': result.rtp,
+            'expected_value_interval': [low, high],
+            'variance': result.variance,
+        }
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.save()
+        return self.entries[key]
+
+    def lookup(self, pin_positions, multiplier_rects, multipliers, physics, engine='scalar'):
+        """Get the cached entry for a board, physics constants and engine, or None"""
+        return self.get(make_key(pin_positions, multiplier_rects, multipliers, physics.get_constants(), engine))
+
+    def get_or_simulate(self, board, balls=1000000, engine='scalar', constants=None, workers=1, seed=None):
+        """Get the entry for a simulation Board with at least `balls` samples.
+
+        Missing entries are simulated. Entries with fewer balls are topped up with
+        the difference and merged, so repeated runs refine the table.
+        """
+        from physics import simulation  # Imported here: simulation imports this module
+
+        physics_constants = BallPhysics().get_constants()
+        physics_constants.update(constants or {})
+        key = make_key(board.pin_positions, board.multiplier_rects, board.multipliers, physics_constants, engine)
+
+        entry = self.get(key)
+        if entry is not None and entry['balls'] >= balls:
+            return entry
+
+        # Keep what's cached when its raw counts were stored; the top-up then needs its own seed
+        previous = None
+        if entry is not None and 'counts' in entry:
+            previous = simulation.SimulationResult(board.multipliers)
+            previous.counts = list(entry['counts'])
+            previous.lost = entry['lost_balls']
+            if seed is not None:
+                seed = simulation.shard_seed(seed, f"top-up:{previous.total}")
+
+        needed = balls - (previous.total if previous else 0)
+        if workers == 1:
+            result = simulation.simulate(board, needed, engine, seed, physics_constants)
+        else:
+            result = simulation.simulate_parallel(board, needed, engine, seed, workers=workers or None,
+                                                  constants=physics_constants)
+        if result.cancelled:
+            return entry  # Don't cache a partial distribution
+        if previous is not None:
+            result.merge(previous)
+        return self.put(key, result)
@@ -0,0 +1,39 @@
+"""Spatial index for pin collision lookups"""
+import math
+
+class PinGrid:
+    """Uniform grid over the pin lattice so a ball only tests the pins near it"""
+
+    def __init__(self, pin_positions, cell_size=30, reach=15):
+        # Grid parameters
+        self.pin_positions = list(pin_positions)
+        self.cell_size = cell_size
+        self.reach = reach  # Largest ball radius + pin radius the index can answer for
+
+        # Bucket every pin index by the cell it sits in
+        buckets = {}
+        for i, (x, y) in enumerate(self.pin_positions):
+            buckets.setdefault(self.cell_of(x, y), []).append(i)
+
+        # Precompute the candidate list for every cell that has a pin within reach,
+        # kept in original pin order so the first hit matches the brute-force scan
+        span = max(1, math.ceil(reach / cell_size))
+        neighbourhoods = {}
+        for (cx, cy), indices in buckets.items():
+            for ox in range(-span, span + 1):
+                for oy in range(-span, span + 1):
+                    neighbourhoods.setdefault((cx + ox, cy + oy), []).extend(indices)
+
+        self.cells = {}
+        for cell, indices in neighbourhoods.items():
+            self.cells[cell] = tuple(self.pin_positions[i] for i in sorted(indices))
+
+    def cell_of(self, x, y):
+        """Get the grid cell containing a point"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def nearby(self, x, y, reach):
+        """Get the pins that may lie within reach of a point, or None if reach is too large"""
+        if reach > self.reach:
+            return None
+        return self.cells.get(self.cell_of(x, y), ())
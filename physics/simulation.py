@@ -0,0 +1,386 @@
+"""Headless Monte Carlo simulation of the Plinko board
+
+Builds the same pin layout and multiplier zones as the game screen without
+opening a window, drops balls through the physics engine and reports the
+landing distribution and return-to-player.
+
+    python -m physics.simulation --balls 1000000 --engine batch
+    python -m physics.simulation --balls 10000000 --workers 32
+"""
+import os
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from physics import board as board_layout
+from physics.ball_physics import BallPhysics
+from physics.batch_physics import BatchBallPhysics
+from physics.game_objects import Ball
+from physics.outcome_cache import OutcomeCache
+from physics.pin_index import PinGrid
+
+# A ball that hasn't settled after this many ticks is counted as lost
+MAX_TICKS_PER_BALL = 5000
+
+class Board:
+    """Pin layout, multiplier zones and walls for one window size"""
+
+    def __init__(self, width=800, height=600, multipliers=None, rows=board_layout.PIN_ROWS):
+        self.width = width
+        self.height = height
+        self.rows = rows
+        self.multipliers = list(multipliers or board_layout.MULTIPLIERS)
+        if len(self.multipliers) != board_layout.zone_count(rows):
+            # The default payout table only fits PIN_ROWS; other row counts need their own
+            raise ValueError(f"{rows} pin rows need {board_layout.zone_count(rows)} multipliers, "
+                             f"got {len(self.multipliers)}")
+        self.pin_positions = board_layout.create_pin_positions(width, rows)
+        self.multiplier_rects = board_layout.create_multiplier_rects(width, len(self.multipliers), rows)
+        self.boundaries = board_layout.create_boundaries(width, height, rows)
+        self.pin_index = PinGrid(self.pin_positions, cell_size=board_layout.HORIZONTAL_SPACING,
+                                 reach=board_layout.PIN_RADIUS + 10)
+        self.zone_top = min(rect.top for rect in self.multiplier_rects)
+
+    def find_zone(self, x, y):
+        """Get the index of the multiplier zone containing a point, or None"""
+        for i, rect in enumerate(self.multiplier_rects):
+            if rect.collidepoint((x, y)):
+                return i
+        return None
+
+
+class SimulationResult:
+    """Per-zone hit counts plus the payout statistics derived from them"""
+
+    def __init__(self, multipliers):
+        self.multipliers = list(multipliers)
+        self.counts = [0] * len(self.multipliers)
+        self.lost = 0  # Balls that fell between zones or never settled
+        self.elapsed = 0.0  # Wall-clock seconds spent simulating
+        self.cancelled = False  # True when a parallel run stopped early
+        self.seed = None  # Seed the run used, so it can be reproduced
+
+    @property
+    def total(self):
+        """Total number of balls dropped"""
+        return sum(self.counts) + self.lost
+
+    def record(self, zone):
+        """Record where one ball landed (None for a lost ball)"""
+        if zone is None:
+            self.lost += 1
+        else:
+            self.counts[zone] += 1
+
+    def merge(self, other):
+        """Add another result's counts into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.lost += other.lost
+        self.elapsed += other.elapsed
+        return self
+
+    @property
+    def rtp(self):
+        """Mean payout per unit bet (return to player)"""
+        if not self.total:
+            return 0.0
+        return sum(c * m for c, m in zip(self.counts, self.multipliers)) / self.total
+
+    @property
+    def variance(self):
+        """Sample variance of the payout per unit bet"""
+        n = self.total
+        if n < 2:
+            return 0.0
+        mean = self.rtp
+        sum_sq = sum(c * m * m for c, m in zip(self.counts, self.multipliers))
+        return max(0.0, (sum_sq - n * mean * mean) / (n - 1))
+
+    def rtp_interval(self, z=1.96):
+        """Normal-approximation confidence interval for the RTP"""
+        if not self.total:
+            return (0.0, 0.0)
+        half_width = z * math.sqrt(self.variance / self.total)
+        return (self.rtp - half_width, self.rtp + half_width)
+
+    def probabilities(self):
+        """Landing probability of every zone"""
+        n = self.total
+        return [c / n if n else 0.0 for c in self.counts]
+
+    def probability_intervals(self, z=1.96):
+        """Wilson score interval for every zone's landing probability"""
+        n = self.total
+        intervals = []
+        for count in self.counts:
+            if not n:
+                intervals.append((0.0, 0.0))
+                continue
+            p = count / n
+            denominator = 1 + z * z / n
+            center = (p + z * z / (2 * n)) / denominator
+            half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+            intervals.append((max(0.0, center - half_width), min(1.0, center + half_width)))
+        return intervals
+
+    @property
+    def throughput(self):
+        """Balls simulated per second"""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        """Get a JSON-serializable summary"""
+        low, high = self.rtp_interval()
+        return {
+            'balls': self.total,
+            'counts': self.counts,
+            'lost': self.lost,
+            'multipliers': self.multipliers,
+            'probabilities': self.probabilities(),
+            'probability_intervals': self.probability_intervals(),
+            'rtp': self.rtp,
+            'rtp_interval': [low, high],
+            'variance': self.variance,
+            'elapsed': self.elapsed,
+            'balls_per_second': self.throughput,
+            'cancelled': self.cancelled,
+            'seed': self.seed,
+        }
+
+
+def drop_ball(board, physics, rng):
+    """Drop one ball the way GameScreen.drop_ball does and return its zone (or None)"""
+    ball = Ball(board.width / 2 + rng.uniform(-20, 20), board_layout.BALL_START_Y,
+                board_layout.BALL_RADIUS, (255, 200, 0), 1.0)
+    ball.dx = rng.uniform(-0.8, 0.8)
+    ball.dy = 2
+
+    bottom = board.boundaries['bottom']
+    zone_top = board.zone_top
+    for _ in range(MAX_TICKS_PER_BALL):
+        physics.update_position(ball, board.pin_positions, board.boundaries)
+        if ball.y < zone_top:
+            continue  # Still above the multiplier zones
+        zone = board.find_zone(ball.x, ball.y)
+        if zone is not None:
+            return zone
+        if ball.y > bottom:
+            return None
+    return None
+
+def simulate_scalar(board, balls, seed=None, constants=None, stop=None):
+    """Drop balls one at a time through BallPhysics. stop() returning True ends the run early."""
+    rng = random.Random(seed)
+    physics = BallPhysics(rng=rng)
+    physics.set_constants(constants or {})
+    physics.pin_index = board.pin_index
+
+    result = SimulationResult(board.multipliers)
+    start = time.perf_counter()
+    for _ in range(balls):
+        if stop is not None and stop():
+            break
+        result.record(drop_ball(board, physics, rng))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+def simulate_batch(board, balls, seed=None, constants=None, population=4096, stop=None):
+    """Drop balls in waves through the vectorized BatchBallPhysics. stop() returning True ends the run early."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    engine = BatchBallPhysics(capacity=population, rng=rng)
+    engine.set_constants(constants or {})
+    engine.set_pins(board.pin_positions, board.pin_index)
+
+    result = SimulationResult(board.multipliers)
+    bottom = board.boundaries['bottom']
+    remaining = balls
+    start = time.perf_counter()
+    while remaining or engine.count:
+        if stop is not None and stop():
+            break
+        
+        # Top the population back up as balls settle
+        spawn = min(remaining, population - engine.count)
+        if spawn:
+            xs = board.width / 2 + rng.uniform(-20, 20, spawn)
+            dxs = rng.uniform(-0.8, 0.8, spawn)
+            for x, dx in zip(xs, dxs):
+                engine.add_ball(x, board_layout.BALL_START_Y, dx, 2, board_layout.BALL_RADIUS,
+                                (255, 200, 0), 1.0)
+            remaining -= spawn
+
+        engine.step(board.boundaries)
+        for _, zone in engine.settle(board.multipliers, board.multiplier_rects, bottom, MAX_TICKS_PER_BALL):
+            result.record(zone)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+def pick_seed(seed):
+    """Get the seed to run with, choosing a random one (to report) when seed is None"""
+    return random.SystemRandom().getrandbits(63) if seed is None else seed
+
+def simulate(board, balls, engine='scalar', seed=None, constants=None, stop=None):
+    """Simulate balls on the board with the chosen engine ('scalar' or 'batch').
+
+    constants overrides BallPhysics constants by name (see PHYSICS_CONSTANTS).
+    stop, if given, is polled between balls and ends the run early when it returns True.
+    """
+    seed = pick_seed(seed)
+    if engine == 'batch':
+        if not BatchBallPhysics.available():
+            raise RuntimeError("The batch engine requires numpy")
+        result = simulate_batch(board, balls, seed, constants, stop=stop)
+    else:
+        result = simulate_scalar(board, balls, seed, constants, stop=stop)
+    result.seed = seed
+    return result
+
+def shard_seed(seed, shard):
+    """Derive an independent, reproducible seed for one shard of a run"""
+    digest = hashlib.sha256(f"{seed}:{shard}".encode()).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+# Boards built in this worker process, keyed by their constructor arguments
+_worker_boards = {}
+
+# Set by simulate_parallel on cancel so running shards stop mid-shard
+_worker_stop = None
+
+def init_worker(stop_event):
+    """Process pool initializer: keep the run's shared stop event"""
+    global _worker_stop
+    _worker_stop = stop_event
+
+def run_shard(board_args, balls, engine, seed, constants=None):
+    """Simulate one shard inside a worker process"""
+    board = _worker_boards.get(board_args)
+    if board is None:
+        width, height, multipliers, rows = board_args
+        board = _worker_boards[board_args] = Board(width, height, multipliers, rows)
+    stop = _worker_stop.is_set if _worker_stop is not None else None
+    return simulate(board, balls, engine, seed, constants, stop=stop)
+
+def simulate_parallel(board, balls, engine='scalar', seed=None, workers=None, shard_size=20000,
+                      progress=None, cancel=None, constants=None, poll_interval=0.1):
+    """Spread a run across a process pool and merge the shard histograms.
+
+    The run is cut into fixed-size shards, each with its own seed derived from
+    (seed, shard number), so the merged result is the same for any worker count.
+    progress(done, total) is called as shards finish. The cancel event (anything
+    with is_set()) is checked every poll_interval seconds; once set, queued shards
+    are dropped, running ones are told to stop after their current ball, and the
+    shards completed so far are returned.
+    """
+    seed = pick_seed(seed)
+
+    board_args = (board.width, board.height, tuple(board.multipliers), board.rows)
+    shard_sizes = [shard_size] * (balls // shard_size)
+    if balls % shard_size:
+        shard_sizes.append(balls % shard_size)
+
+    result = SimulationResult(board.multipliers)
+    result.seed = seed
+    start = time.perf_counter()
+    context = multiprocessing.get_context()
+    stop_event = context.Event()
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=init_worker, initargs=(stop_event,))
+    try:
+        pending = {pool.submit(run_shard, board_args, size, engine, shard_seed(seed, shard), constants)
+                   for shard, size in enumerate(shard_sizes)}
+        while pending:
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                result.merge(future.result())
+            if done and progress:
+                progress(result.total, balls)
+    except KeyboardInterrupt:
+        result.cancelled = True
+    finally:
+        # Don't wait out running shards on cancel; their results are discarded
+        if result.cancelled:
+            stop_event.set()
+        pool.shutdown(wait=not result.cancelled, cancel_futures=True)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+def format_report(result):
+    """Format a result as a human-readable table"""
+    lines = [f"{'zone':>4} {'mult':>6} {'hits':>10} {'prob':>9}  95% interval"]
+    for i, (multiplier, count, p, (low, high)) in enumerate(zip(
+            result.multipliers, result.counts, result.probabilities(), result.probability_intervals())):
+        lines.append(f"{i:>4} {multiplier:>5}x {count:>10} {p:>9.5f}  [{low:.5f}, {high:.5f}]")
+    low, high = result.rtp_interval()
+    lines.append(f"lost: {result.lost}")
+    lines.append(f"RTP: {result.rtp:.4f}  (95% CI {low:.4f} - {high:.4f})  variance: {result.variance:.3f}")
+    lines.append(f"{result.total} balls in {result.elapsed:.2f}s ({result.throughput:,.0f} balls/sec)")
+    lines.append(f"seed: {result.seed}")
+    if result.cancelled:
+        lines.append("cancelled: partial result")
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo simulation of the Plinko board")
+    parser.add_argument('--balls', type=int, default=100000, help="number of balls to drop")
+    parser.add_argument('--engine', choices=['scalar', 'batch'], default='scalar')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--width', type=int, default=800)
+    parser.add_argument('--height', type=int, default=600)
+    parser.add_argument('--rows', type=int, default=board_layout.PIN_ROWS)
+    parser.add_argument('--multipliers', type=float, nargs='+',
+                        help="payout table, left to right (rows + 3 values; needed when --rows changes)")
+    parser.add_argument('--gravity', type=float)
+    parser.add_argument('--bounce-damping', type=float)
+    parser.add_argument('--elasticity', type=float)
+    parser.add_argument('--cache', metavar='PATH', help="read/write the outcome cache at PATH")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes (0 = one per core)")
+    parser.add_argument('--shard-size', type=int, default=20000, help="balls per parallel shard")
+    parser.add_argument('--json', action='store_true', help="print machine-readable JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        board = Board(args.width, args.height, args.multipliers, args.rows)
+    except ValueError as error:
+        parser.error(str(error))
+    constants = {name: value for name, value in (('gravity', args.gravity),
+                                                 ('bounce_damping', args.bounce_damping),
+                                                 ('elasticity', args.elasticity)) if value is not None}
+
+    if args.cache:
+        cache = OutcomeCache(args.cache)
+        entry = cache.get_or_simulate(board, args.balls, args.engine, constants,
+                                      workers=args.workers, seed=args.seed)
+        cache.flush()
+        print(json.dumps(entry, indent=2))
+        return
+
+    if args.workers == 1:
+        result = simulate(board, args.balls, args.engine, args.seed, constants)
+    else:
+        def report_progress(done, total):
+            print(f"\r{done}/{total} balls", end='', file=sys.stderr, flush=True)
+
+        result = simulate_parallel(board, args.balls, args.engine, args.seed,
+                                   workers=args.workers or None, shard_size=args.shard_size,
+                                   progress=report_progress, constants=constants)
+        print(file=sys.stderr)
+    if args.json:
+        print(json.dumps(result.as_dict(), indent=2))
+    else:
+        print(format_report(result))
+
+if __name__ == "__main__":
+    main()
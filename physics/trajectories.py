@@ -0,0 +1,196 @@
+"""Library of recorded ball trajectories for near-free playback
+
+A library is a directory holding frames.npy (one int16 row of quantized x, y
+and collision flash per tick, for every path back to back) and index.json
+(where each path starts, grouped by landing zone, plus paths of balls that
+were lost). Build one with
+
+    python -m physics.trajectories --out trajectories --per-zone 100
+"""
+import os
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import json
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; GameScreen falls back to live physics without it
+    np = None
+
+from physics import board as board_layout
+from physics.ball_physics import BallPhysics
+from physics.game_objects import Ball
+from physics.outcome_cache import make_key
+
+# Positions are stored in 1/SCALE pixel steps so they fit in int16
+SCALE = 8
+
+def record_path(board, physics, rng):
+    """Drop one ball and return (zone, [(x, y, flash), ...]) for every tick"""
+    ball = Ball(board.width / 2 + rng.uniform(-20, 20), board_layout.BALL_START_Y,
+                board_layout.BALL_RADIUS, (255, 200, 0), 1.0)
+    ball.dx = rng.uniform(-0.8, 0.8)
+    ball.dy = 2
+
+    path = [(ball.x, ball.y, 0)]
+    for _ in range(5000):
+        physics.update_position(ball, board.pin_positions, board.boundaries)
+        path.append((ball.x, ball.y, ball.collision_flash))
+        if ball.y >= board.zone_top:
+            zone = board.find_zone(ball.x, ball.y)
+            if zone is not None:
+                return zone, path
+            if ball.y > board.boundaries['bottom']:
+                break
+    return None, path
+
+def pack_paths(paths, rows):
+    """Append quantized frames of each path to rows and return their [start, length] spans"""
+    spans = []
+    for frames in paths:
+        spans.append([len(rows), len(frames)])
+        rows.extend((round(x * SCALE), round(y * SCALE), flash) for x, y, flash in frames)
+    return spans
+
+def record_library(board, path, per_zone=100, max_balls=200000, seed=None, patience=10000):
+    """Record up to per_zone real trajectories per landing zone and save them to path.
+
+    Stops once every zone is full, or once patience drops in a row added no path
+    (zones the balls can't reach would otherwise run the full max_balls).
+    """
+    rng = random.Random(seed)
+    physics = BallPhysics(pin_index=board.pin_index, rng=rng)
+
+    hits = [0] * len(board.multipliers)
+    paths = [[] for _ in board.multipliers]
+    lost = 0  # Balls that never landed in a zone; playback loses them as often
+    lost_paths = []
+    stalled = 0  # Drops since a zone last got a new path
+    for _ in range(max_balls):
+        zone, frames = record_path(board, physics, rng)
+        stalled += 1
+        if zone is None:
+            lost += 1
+            if len(lost_paths) < per_zone:
+                lost_paths.append(frames)
+        else:
+            hits[zone] += 1
+            if len(paths[zone]) < per_zone:
+                paths[zone].append(frames)
+                stalled = 0
+        if all(len(zone_paths) >= per_zone for zone_paths in paths) or stalled >= patience:
+            break
+
+    # Pack every path back to back and remember where each one starts
+    rows = []
+    index = [pack_paths(zone_paths, rows) for zone_paths in paths]
+    lost_index = pack_paths(lost_paths, rows)
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, 'frames.npy'), np.array(rows, dtype=np.int16).reshape(-1, 3))
+    with open(os.path.join(path, 'index.json'), 'w') as f:
+        json.dump({
+            'scale': SCALE,
+            'board_key': make_key(board.pin_positions, board.multiplier_rects, board.multipliers,
+                                  physics.get_constants()),
+            'hits': hits,
+            'paths': index,
+            'lost': lost,
+            'lost_paths': lost_index,
+        }, f)
+
+
+class PlaybackBall:
+    """A ball that replays a recorded trajectory instead of simulating"""
+
+    __slots__ = ('frames', 'scale', 'zone', 'color', 'bet_amount', 'radius', 'frame',
+                 'x', 'y', 'prev_x', 'prev_y', 'collision_flash')
+
+    def __init__(self, frames, scale, zone, color, bet_amount, radius=board_layout.BALL_RADIUS):
+        self.frames = frames  # Memory-mapped (n, 3) int16 view
+        self.scale = scale
+        self.zone = zone  # Landing zone, or None for a ball that is lost (pays nothing)
+        self.color = color
+        self.bet_amount = bet_amount
+        self.radius = radius
+        self.frame = 0
+        self.x, self.y, self.collision_flash = self.read(0)
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def read(self, frame):
+        """Get the position and flash stored for a frame"""
+        x, y, flash = self.frames[frame]
+        return x / self.scale, y / self.scale, int(flash)
+
+    @property
+    def finished(self):
+        """True once the last recorded frame (inside the landing zone) is reached"""
+        return self.frame >= len(self.frames) - 1
+
+    def advance(self):
+        """Move to the next recorded tick"""
+        self.prev_x, self.prev_y = self.x, self.y
+        if not self.finished:
+            self.frame += 1
+            self.x, self.y, self.collision_flash = self.read(self.frame)
+
+
+class TrajectoryLibrary:
+    """Memory-mapped recorded trajectories, indexed by landing zone"""
+
+    def __init__(self, path):
+        if np is None:
+            raise ImportError("TrajectoryLibrary requires numpy")
+        with open(os.path.join(path, 'index.json'), 'r') as f:
+            index = json.load(f)
+        self.frames = np.load(os.path.join(path, 'frames.npy'), mmap_mode='r')
+        self.scale = index['scale']
+        self.board_key = index['board_key']
+        self.paths = index['paths']
+
+        # Pick zones with their recorded frequency, among zones that have a path.
+        # Lost balls are an outcome too (zone None), so playback loses as many as live physics.
+        self.lost_paths = index.get('lost_paths', [])
+        self.zones = [zone for zone, spans in enumerate(self.paths) if spans]
+        self.weights = [index['hits'][zone] for zone in self.zones]
+        if self.lost_paths and index.get('lost'):
+            self.zones.append(None)
+            self.weights.append(index['lost'])
+
+    def matches(self, pin_positions, multiplier_rects, multipliers, physics):
+        """Check whether the library was recorded on this board with these physics"""
+        return self.board_key == make_key(pin_positions, multiplier_rects, multipliers,
+                                          physics.get_constants())
+
+    def spawn(self, color, bet_amount, rng=random):
+        """Pick an outcome zone, then a recorded path that lands there, and start playing it"""
+        zone = rng.choices(self.zones, weights=self.weights)[0]
+        start, length = rng.choice(self.paths[zone] if zone is not None else self.lost_paths)
+        return PlaybackBall(self.frames[start:start + length], self.scale, zone, color, bet_amount)
+
+
+def main(argv=None):
+    from physics.simulation import Board
+
+    parser = argparse.ArgumentParser(description="Record a trajectory library for playback mode")
+    parser.add_argument('--out', default='trajectories', help="library directory")
+    parser.add_argument('--per-zone', type=int, default=100, help="paths to keep per landing zone")
+    parser.add_argument('--max-balls', type=int, default=200000, help="stop after this many drops")
+    parser.add_argument('--patience', type=int, default=10000,
+                        help="stop after this many drops in a row add no path (unreachable zones)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--width', type=int, default=800)
+    parser.add_argument('--height', type=int, default=600)
+    args = parser.parse_args(argv)
+
+    record_library(Board(args.width, args.height), args.out, args.per_zone, args.max_balls, args.seed,
+                   args.patience)
+    library = TrajectoryLibrary(args.out)
+    print(f"{sum(len(spans) for spans in library.paths) + len(library.lost_paths)} paths, "
+          f"{len(library.frames)} frames "
+          f"({library.frames.nbytes / 1024:.0f} KiB) in {args.out}")
+
+if __name__ == "__main__":
+    main()
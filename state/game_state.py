@@ -6,6 +6,7 @@ class GameState:
     def __init__(self):
         # Financial state
         self.coins = 0  # Starting with 0 coins instead of 100
+        self.reserved_coins = 0  # Held for queued drops (see SpawnScheduler)
         
         # Skins and items
         self.active_ball_skin = "default"  # Default ball skin
@@ -27,6 +28,22 @@ class GameState:
             return True
         return False
     
+    def reserve_coins(self, amount):
+        """Move coins from the balance into the reserve if possible"""
+        if self.subtract_coins(amount):
+            self.reserved_coins = round(self.reserved_coins + amount, 2)
+            return True
+        return False
+    
+    def spend_reserved_coins(self, amount):
+        """Spend coins that were reserved earlier"""
+        self.reserved_coins = round(max(0, self.reserved_coins - amount), 2)
+    
+    def release_reserved_coins(self, amount):
+        """Return reserved coins to the balance"""
+        self.reserved_coins = round(max(0, self.reserved_coins - amount), 2)
+        self.add_coins(amount)
+    
     def set_active_skin(self, skin_name):
         """Set the active ball skin"""
         if skin_name in self.purchased_skins:
@@ -0,0 +1,72 @@
+from collections import deque
+
+class SpawnScheduler:
+    """Queues ball drops, staggers their spawns and holds them back while too many balls are live"""
+    
+    def __init__(self, game_state, spawn_ball, max_live=300):
+        self.game_state = game_state
+        self.spawn_ball = spawn_ball  # Callback that drops an already-paid ball
+        self.max_live = max_live  # Cap on concurrent live balls
+        
+        # Pending drops as (bet_amount, ticks to wait after spawning it, source)
+        self.queue = deque()
+        self.queued = {}  # source -> drops of it still waiting
+        self.cooldown = 0
+        
+    @property
+    def pending(self):
+        """Number of drops still waiting to spawn"""
+        return len(self.queue)
+        
+    def pending_from(self, source):
+        """Number of drops queued by one source (e.g. 'auto') still waiting to spawn"""
+        return self.queued.get(source, 0)
+        
+    def enqueue(self, bet_amount, count, interval, front=False, source=None):
+        """Queue up to count drops, reserving their bets up front. Returns how many were queued.
+        
+        front puts them ahead of drops already waiting (used for bursts). source
+        labels them so they can be counted and cancelled apart from the rest.
+        """
+        queued = 0
+        for _ in range(count):
+            if bet_amount <= 0 or not self.game_state.reserve_coins(bet_amount):
+                break
+            if front:
+                self.queue.appendleft((bet_amount, interval, source))
+            else:
+                self.queue.append((bet_amount, interval, source))
+            queued += 1
+        if queued:
+            self.queued[source] = self.queued.get(source, 0) + queued
+        if front:
+            self.cooldown = 0
+        return queued
+        
+    def cancel(self, source=None):
+        """Drop what is still queued, or just one source's drops, and refund the reserved bets"""
+        kept = deque()
+        while self.queue:
+            drop = self.queue.popleft()
+            if source is None or drop[2] == source:
+                self.game_state.release_reserved_coins(drop[0])
+            else:
+                kept.append(drop)
+        self.queue = kept
+        if source is None:
+            self.queued.clear()
+            self.cooldown = 0
+        else:
+            self.queued.pop(source, None)
+        
+    def update(self, live_balls):
+        """Advance one tick, spawning the next drop if it's due and there is room"""
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if self.queue and live_balls < self.max_live:
+            bet_amount, interval, source = self.queue.popleft()
+            self.queued[source] -= 1
+            self.game_state.spend_reserved_coins(bet_amount)
+            self.spawn_ball(bet_amount)
+            self.cooldown = interval
@@ -1,10 +1,14 @@
 import pygame
+from core.fonts import get_font
+from core.text_cache import render_text
+from core.event_dispatch import HitIndex
 
 class BaseScreen:
     def __init__(self, settings_manager):
         self.settings_manager = settings_manager
         self.hovered_button = None
         self.buttons = {}
+        self.hit_index = HitIndex()  # Hover lookups over self.buttons
         
         # Common colors
         self.WHITE = (255, 255, 255)
@@ -17,9 +21,9 @@ class BaseScreen:
         self.GOLD = (255, 215, 0)
         
         # Common fonts
-        self.title_font = pygame.font.Font(None, 74)
-        self.button_font = pygame.font.Font(None, 36)
-        self.coin_font = pygame.font.Font(None, 40)
+        self.title_font = get_font(74)
+        self.button_font = get_font(36)
+        self.coin_font = get_font(40)
         
     def update_button_positions(self):
         """Update button positions based on screen size"""
@@ -42,7 +46,7 @@ class BaseScreen:
             pygame.draw.rect(screen, self.WHITE, button_rect, border_radius=10, width=2)
             
         # Draw button text
-        text_surface = self.button_font.render(text, True, self.WHITE)
+        text_surface = render_text(self.button_font, text, True, self.WHITE)
         text_rect = text_surface.get_rect(center=button_rect.center)
         screen.blit(text_surface, text_rect)
         
@@ -69,11 +73,8 @@ class BaseScreen:
                 
     def update_hover_state(self, pos):
         """Update which button is being hovered"""
-        self.hovered_button = None
-        for button_name, button_rect in self.buttons.items():
-            if button_rect.collidepoint(pos):
-                self.hovered_button = button_name
-                break
+        self.hit_index.update(self.buttons)
+        self.hovered_button = self.hit_index.hit(pos)
                 
     def handle_click(self, pos):
         """Handle mouse clicks on buttons"""
@@ -85,4 +86,16 @@ class BaseScreen:
         
     def update(self):
         """Update screen state"""
-        pass 
\ No newline at end of file
+        pass
+        
+    def is_animating(self):
+        """Whether the screen changes without input (static screens let the game idle)"""
+        return False
+        
+    def on_enter(self):
+        """Called each time the screen is shown (see core.screen_registry)"""
+        pass
+        
+    def on_exit(self):
+        """Called when another screen replaces this one"""
+        self.hovered_button = None 
\ No newline at end of file
@@ -2,6 +2,9 @@ import pygame
 import math
 import random
 from .base_screen import BaseScreen
+from core.fonts import get_font
+from core.text_cache import render_text
+from ui_components.particles import ParticleSystem, render_glow_ball
 
 class MenuScreen(BaseScreen):
     def __init__(self, settings_manager, on_start, on_settings, on_shop, on_quit, on_skins=None):
@@ -17,7 +20,7 @@ class MenuScreen(BaseScreen):
         # Title animation properties
         self.title_points = []
         self.title_animation_time = 0
-        self.particles = []  # For particle effects
+        self.particles = ParticleSystem(capacity=256)  # Sparkles around the title
         self.generate_title_arc()
         self.update_button_positions()
         
@@ -25,7 +28,8 @@ class MenuScreen(BaseScreen):
         self.coins = 100  # Starting amount
         
         # Add floating balls in background
-        self.floating_balls = []
+        self.floating_balls = ParticleSystem(capacity=32, render_sprite=render_glow_ball,
+                                             bounds=self.settings_manager.get_window_size())
         for _ in range(10):
             self.add_floating_ball()
             
@@ -43,15 +47,9 @@ class MenuScreen(BaseScreen):
             (255, 255, 255)  # White
         ])
         
-        self.floating_balls.append({
-            'x': x,
-            'y': y,
-            'speed_x': speed_x,
-            'speed_y': speed_y,
-            'size': size,
-            'color': color,
-            'alpha': random.randint(50, 150)
-        })
+        # Floating balls never expire
+        self.floating_balls.emit(x, y, speed_x, speed_y, size, color,
+                                 alpha=random.randint(50, 150))
     
     def update_button_positions(self):
         """Update button positions based on screen size"""
@@ -106,23 +104,17 @@ class MenuScreen(BaseScreen):
             y = base_y - math.sin(angle) * arc_height
             self.title_points.append((x, y, text[i]))
             
+    def is_animating(self):
+        """The background animates continuously"""
+        return True
+    
     def update(self):
         """Update animation states"""
         # Update title animation
         self.title_animation_time += 0.02
         
-        # Update floating balls
-        width, height = self.settings_manager.get_window_size()
-        for ball in self.floating_balls:
-            # Move balls
-            ball['x'] += ball['speed_x']
-            ball['y'] += ball['speed_y']
-            
-            # Bounce off walls
-            if ball['x'] < 0 or ball['x'] > width:
-                ball['speed_x'] *= -1
-            if ball['y'] < 0 or ball['y'] > height:
-                ball['speed_y'] *= -1
+        # Update floating balls (they bounce off the window edges)
+        self.floating_balls.update()
                 
         # Add particles occasionally
         if random.random() < 0.1:
@@ -131,23 +123,14 @@ class MenuScreen(BaseScreen):
                 point = random.choice(self.title_points)
                 particle_x = point[0] + random.uniform(-20, 20)
                 particle_y = point[1] + random.uniform(-10, 30)
-                self.particles.append({
-                    'x': particle_x,
-                    'y': particle_y,
-                    'speed_x': random.uniform(-0.3, 0.3),
-                    'speed_y': random.uniform(-0.5, 0.2),
-                    'size': random.uniform(2, 5),
-                    'lifetime': 100,
-                    'color': (255, 215, 0)  # Gold particles
-                })
+                self.particles.emit(particle_x, particle_y,
+                                    random.uniform(-0.3, 0.3), random.uniform(-0.5, 0.2),
+                                    random.uniform(2, 5),
+                                    (255, 215, 0),  # Gold particles
+                                    lifetime=100)
                 
-        # Update particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['lifetime'] -= 1
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+        # Update particles, dropping expired ones
+        self.particles.update()
     
     def draw_money_counter(self, screen):
         """Draw money counter with improved design"""
@@ -182,11 +165,11 @@ class MenuScreen(BaseScreen):
         pygame.draw.circle(screen, (200, 170, 0), (coin_x, coin_y), 12)
         
         # Draw count with shadow for better visibility
-        count_text = self.coin_font.render(str(self.coins), True, self.BLACK)
+        count_text = render_text(self.coin_font, str(self.coins), True, self.BLACK)
         count_rect = count_text.get_rect(midleft=(coin_x + 25, coin_y))
         screen.blit(count_text, (count_rect.x+1, count_rect.y+1))  # Black shadow
         
-        count_text = self.coin_font.render(str(self.coins), True, self.WHITE)
+        count_text = render_text(self.coin_font, str(self.coins), True, self.WHITE)
         screen.blit(count_text, count_rect)
         
         # Draw shop button with improved design
@@ -195,8 +178,7 @@ class MenuScreen(BaseScreen):
                                                        self.shop_button.width, self.shop_button.height), border_radius=5)
         pygame.draw.rect(screen, shop_color, self.shop_button, border_radius=5)
         
-        plus_font = pygame.font.Font(None, 48)
-        plus_text = plus_font.render("+", True, self.WHITE)
+        plus_text = render_text(get_font(48), "+", True, self.WHITE)
         plus_rect = plus_text.get_rect(center=self.shop_button.center)
         screen.blit(plus_text, plus_rect)
         
@@ -204,33 +186,12 @@ class MenuScreen(BaseScreen):
         self.buttons['shop_direct'] = self.shop_button
         
     def draw_particles(self, screen):
-        """Draw particle effects"""
-        for particle in self.particles:
-            # Calculate alpha based on lifetime
-            alpha = min(255, int(particle['lifetime'] * 2.55))
-            
-            # Create a surface with alpha
-            particle_surf = pygame.Surface((int(particle['size']*2), int(particle['size']*2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (*particle['color'], alpha), 
-                              (int(particle['size']), int(particle['size'])), 
-                              int(particle['size']))
-            
-            screen.blit(particle_surf, (int(particle['x'] - particle['size']), 
-                                      int(particle['y'] - particle['size'])))
+        """Draw particle effects, fading out with their lifetime"""
+        self.particles.draw(screen)
     
     def draw_floating_balls(self, screen):
         """Draw decorative floating balls in background"""
-        for ball in self.floating_balls:
-            # Create a surface with alpha for the ball
-            ball_surf = pygame.Surface((ball['size']*2, ball['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(ball_surf, (*ball['color'], ball['alpha']), 
-                              (ball['size'], ball['size']), ball['size'])
-            
-            # Add a subtle glow
-            pygame.draw.circle(ball_surf, (*ball['color'], ball['alpha']//3), 
-                              (ball['size'], ball['size']), ball['size']+2)
-            
-            screen.blit(ball_surf, (int(ball['x'] - ball['size']), int(ball['y'] - ball['size'])))
+        self.floating_balls.draw(screen)
             
     def draw(self, screen):
         """Draw the menu screen"""
@@ -247,12 +208,12 @@ class MenuScreen(BaseScreen):
             animated_y = y + math.sin(self.title_animation_time + i * 0.5) * 5
             
             # Draw shadow for 3D effect
-            shadow_text = self.title_font.render(char, True, (0, 0, 0, 128))
+            shadow_text = render_text(self.title_font, char, True, (0, 0, 0, 128))
             shadow_rect = shadow_text.get_rect(center=(x+3, animated_y+3))
             screen.blit(shadow_text, shadow_rect)
             
             # Draw main text
-            text = self.title_font.render(char, True, title_color)
+            text = render_text(self.title_font, char, True, title_color)
             rect = text.get_rect(center=(x, animated_y))
             screen.blit(text, rect)
             
@@ -261,9 +222,8 @@ class MenuScreen(BaseScreen):
         
         # Draw subtitle
         subtitle_text = "The Ultimate Chance Game"
-        subtitle_font = pygame.font.Font(None, 40)
         subtitle_color = self.WHITE if self.settings_manager.get_setting('dark_mode') else (50, 50, 50)
-        subtitle = subtitle_font.render(subtitle_text, True, subtitle_color)
+        subtitle = render_text(get_font(40), subtitle_text, True, subtitle_color)
         subtitle_rect = subtitle.get_rect(center=(self.settings_manager.get_setting('width') // 2, 180))
         screen.blit(subtitle, subtitle_rect)
         
@@ -1,5 +1,6 @@
 import pygame
 from .base_screen import BaseScreen
+from core.text_cache import render_text
 
 class SettingsScreen(BaseScreen):
     def __init__(self, settings_manager, on_back):
@@ -57,13 +58,13 @@ class SettingsScreen(BaseScreen):
         
         # Draw title
         title_color = self.WHITE if self.settings_manager.get_setting('dark_mode') else self.BLACK
-        title = self.title_font.render("Settings", True, title_color)
+        title = render_text(self.title_font, "Settings", True, title_color)
         title_rect = title.get_rect(center=(self.settings_manager.get_setting('width') // 2, 100))
         screen.blit(title, title_rect)
         
         # Draw window size selector
         text_color = self.WHITE if self.settings_manager.get_setting('dark_mode') else self.BLACK
-        size_text = self.button_font.render("Window Size:", True, text_color)
+        size_text = render_text(self.button_font, "Window Size:", True, text_color)
         size_rect = size_text.get_rect(center=(self.settings_manager.get_setting('width') // 2, 170))
         screen.blit(size_text, size_rect)
         
@@ -73,7 +74,7 @@ class SettingsScreen(BaseScreen):
         
         # Draw current size
         current_size = self.window_sizes[self.selected_size_index]
-        size_value = self.button_font.render(current_size, True, text_color)
+        size_value = render_text(self.button_font, current_size, True, text_color)
         size_value_rect = size_value.get_rect(center=(self.settings_manager.get_setting('width') // 2, 215))
         screen.blit(size_value, size_value_rect)
         
@@ -83,7 +84,7 @@ class SettingsScreen(BaseScreen):
         self.draw_button(screen, 'dark_mode', self.buttons['dark_mode'], dark_mode_text)
         
         # Draw volume control
-        volume_text = self.button_font.render("Volume:", True, text_color)
+        volume_text = render_text(self.button_font, "Volume:", True, text_color)
         volume_rect = volume_text.get_rect(center=(self.settings_manager.get_setting('width') // 2, 370))
         screen.blit(volume_text, volume_rect)
         
@@ -94,7 +95,7 @@ class SettingsScreen(BaseScreen):
         # Draw volume level
         volume = self.settings_manager.get_setting('volume', 0.5)
         volume_percent = int(volume * 100)
-        volume_value = self.button_font.render(f"{volume_percent}%", True, text_color)
+        volume_value = render_text(self.button_font, f"{volume_percent}%", True, text_color)
         volume_value_rect = volume_value.get_rect(center=(self.settings_manager.get_setting('width') // 2, 415))
         screen.blit(volume_value, volume_value_rect)
         
@@ -1,5 +1,7 @@
 import pygame
 from .base_screen import BaseScreen
+from core.fonts import get_font
+from core.text_cache import render_text
 
 class ShopScreen(BaseScreen):
     def __init__(self, settings_manager, on_back, coins, purchased_skins=None):
@@ -58,6 +60,13 @@ class ShopScreen(BaseScreen):
             item_y = start_y + (i - self.scroll_offset) * (item_height + item_spacing)
             self.buttons[f'item_{i}'] = pygame.Rect(width // 2 - item_width // 2, item_y, item_width, item_height)
             
+    def on_enter(self, coins=None, purchased_skins=None):
+        """Pick up the balance and skins the player has now"""
+        if coins is not None:
+            self.update_coins(coins)
+        if purchased_skins is not None:
+            self.purchased_skins = purchased_skins
+        
     def update_coins(self, coins):
         """Update coin balance"""
         self.coins = coins
@@ -69,7 +78,7 @@ class ShopScreen(BaseScreen):
         
         # Draw title
         title_color = self.WHITE if self.settings_manager.get_setting('dark_mode') else self.BLACK
-        title = self.title_font.render("Shop", True, title_color)
+        title = render_text(self.title_font, "Shop", True, title_color)
         title_rect = title.get_rect(center=(self.settings_manager.get_setting('width') // 2, 100))
         screen.blit(title, title_rect)
         
@@ -87,7 +96,7 @@ class ShopScreen(BaseScreen):
         pygame.draw.circle(screen, (200, 170, 0), (coin_x, coin_y), 12)
         
         # Draw coin amount
-        coin_text = self.coin_font.render(str(self.coins), True, self.WHITE)
+        coin_text = render_text(self.coin_font, str(self.coins), True, self.WHITE)
         coin_rect = coin_text.get_rect(midleft=(coin_x + 20, coin_y))
         screen.blit(coin_text, coin_rect)
         
@@ -142,27 +151,27 @@ class ShopScreen(BaseScreen):
             pygame.draw.rect(screen, self.WHITE, self.buttons[button_name], border_radius=10, width=2)
             
             # Draw item name
-            name_text = self.button_font.render(item["name"], True, self.WHITE)
+            name_text = render_text(self.button_font, item["name"], True, self.WHITE)
             name_rect = name_text.get_rect(midtop=(self.buttons[button_name].centerx, self.buttons[button_name].top + 15))
             screen.blit(name_text, name_rect)
             
             # Draw price or description
             if "coins" in item:  # Coin purchase
-                price_text = self.button_font.render(f"${item['price']:.2f}", True, self.GOLD)
+                price_text = render_text(self.button_font, f"${item['price']:.2f}", True, self.GOLD)
                 price_rect = price_text.get_rect(midbottom=(self.buttons[button_name].centerx, self.buttons[button_name].bottom - 15))
                 screen.blit(price_text, price_rect)
             else:  # Item purchase
                 # Show "Purchased" text for already purchased items
                 if already_purchased:
-                    status_text = self.button_font.render("Purchased", True, self.GOLD)
+                    status_text = render_text(self.button_font, "Purchased", True, self.GOLD)
                 else:
-                    status_text = self.button_font.render(f"{item['price']} coins", True, self.GOLD)
+                    status_text = render_text(self.button_font, f"{item['price']} coins", True, self.GOLD)
                 
                 status_rect = status_text.get_rect(midbottom=(self.buttons[button_name].centerx, self.buttons[button_name].bottom - 15))
                 screen.blit(status_text, status_rect)
                 
                 if "description" in item:
-                    desc_text = pygame.font.Font(None, 24).render(item["description"], True, self.WHITE)
+                    desc_text = render_text(get_font(24), item["description"], True, self.WHITE)
                     desc_rect = desc_text.get_rect(midtop=(self.buttons[button_name].centerx, name_rect.bottom + 5))
                     screen.blit(desc_text, desc_rect)
         
@@ -1,6 +1,7 @@
 import pygame
 import random
 from .base_screen import BaseScreen
+from core.text_cache import render_text
 
 class SkinsScreen(BaseScreen):
     def __init__(self, settings_manager, on_back, purchased_skins, active_skin, on_skin_selected):
@@ -46,6 +47,13 @@ class SkinsScreen(BaseScreen):
         # Initialize buttons and UI elements
         self.update_button_positions()
         
+    def on_enter(self, purchased_skins=None, active_skin=None):
+        """Pick up skins bought or selected while the screen was away"""
+        if purchased_skins is not None:
+            self.purchased_skins = purchased_skins
+        if active_skin is not None:
+            self.active_skin = active_skin
+        
     def create_preview_balls(self):
         """Create some animated balls to preview the skin"""
         self.preview_balls = []
@@ -106,6 +114,10 @@ class SkinsScreen(BaseScreen):
             'next_skin': pygame.Rect(width // 2 + 100, height // 2 + 80, 80, 40)
         }
     
+    def is_animating(self):
+        """The background animates continuously"""
+        return True
+    
     def update(self):
         """Update animations and state"""
         # Update animation timer
@@ -151,7 +163,7 @@ class SkinsScreen(BaseScreen):
         
         # Draw title
         title_color = self.WHITE if self.settings_manager.get_setting('dark_mode') else self.BLACK
-        title = self.title_font.render("Ball Skins", True, title_color)
+        title = render_text(self.title_font, "Ball Skins", True, title_color)
         title_rect = title.get_rect(center=(width // 2, 60))
         screen.blit(title, title_rect)
         
@@ -174,12 +186,12 @@ class SkinsScreen(BaseScreen):
         
         # Draw skin name
         skin_name = current_skin["name"]
-        name_text = self.title_font.render(skin_name, True, title_color)
+        name_text = render_text(self.title_font, skin_name, True, title_color)
         name_rect = name_text.get_rect(center=(width // 2, height // 2 - 20))
         screen.blit(name_text, name_rect)
         
         # Draw skin description
-        desc_text = self.button_font.render(current_skin["description"], True, title_color)
+        desc_text = render_text(self.button_font, current_skin["description"], True, title_color)
         desc_rect = desc_text.get_rect(center=(width // 2, height // 2 + 20))
         screen.blit(desc_text, desc_rect)
         
@@ -196,7 +208,7 @@ class SkinsScreen(BaseScreen):
             select_text = "Locked"
             
         pygame.draw.rect(screen, select_color, self.buttons['select_skin'], border_radius=10)
-        select_text_surf = self.button_font.render(select_text, True, self.WHITE)
+        select_text_surf = render_text(self.button_font, select_text, True, self.WHITE)
         select_text_rect = select_text_surf.get_rect(center=self.buttons['select_skin'].center)
         screen.blit(select_text_surf, select_text_rect)
         
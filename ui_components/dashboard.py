@@ -1,19 +1,31 @@
 import pygame
+from core.fonts import get_font
+from core.text_cache import render_text
+from core.event_dispatch import HitIndex
 
 class Dashboard:
     """Dashboard UI component for controlling the game"""
     
-    def __init__(self, settings_manager, on_drop_ball, game_state):
+    def __init__(self, settings_manager, on_drop_ball, game_state, spawner=None):
         self.settings_manager = settings_manager
         self.on_drop_ball = on_drop_ball
         self.game_state = game_state
+        self.spawner = spawner  # SpawnScheduler for auto and burst drops
         self.amount = 0.0  # Bet amount
         
+        # Auto-bet and burst settings (auto rate is in balls per second)
+        self.auto_count = settings_manager.get_setting('auto_drop_count', 50)
+        self.auto_rate = settings_manager.get_setting('auto_drop_rate', 5)
+        if not self.auto_rate or self.auto_rate < 0:
+            self.auto_rate = 5  # A rate of 0 would never drop; fall back to the default
+        self.burst_size = settings_manager.get_setting('burst_size', 10)
+        
         # Dashboard state
         self.dashboard_extended = True  # Always show dashboard
         self.dashboard_y = 0  # Position from bottom
         self.dashboard_buttons = {}
         self.hovered_button = None
+        self.hit_index = HitIndex()  # Hover lookups over dashboard_buttons
         
         # Risk options and state
         self.risks = ["Easy (2%)", "Medium (15%)", "Hard (40%)"]
@@ -35,14 +47,25 @@ class Dashboard:
         self.GREEN = (50, 200, 100)
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 32)
-        self.button_font = pygame.font.Font(None, 28)
-        self.coin_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(32)
+        self.button_font = get_font(28)
+        self.coin_font = get_font(24)
         
     def update(self):
         """Update dashboard animation"""
         pass  # No longer need animation since dashboard is always visible
         
+    def get_rect(self):
+        """Get the panel area draw() paints over"""
+        width, height = self.settings_manager.get_window_size()
+        return pygame.Rect(0, height - 150, width, 120)
+        
+    def get_state(self):
+        """Get everything draw() depends on, to tell when the panel needs redrawing"""
+        return (self.game_state.coins, self.amount, self.selected_risk, self.hovered_button,
+                self.spawner.pending_from('auto') if self.spawner else 0,
+                self.settings_manager.get_setting('dark_mode', False))
+        
     def draw(self, screen):
         """Draw the dashboard"""
         width = self.settings_manager.get_setting('width')
@@ -69,7 +92,7 @@ class Dashboard:
         # Balance label with icon
         balance_icon = "💰"  # Money bag emoji
         balance_label_text = f"{balance_icon} BALANCE"
-        balance_label = self.coin_font.render(balance_label_text, True, self.LIGHT_GRAY)
+        balance_label = render_text(self.coin_font, balance_label_text, True, self.LIGHT_GRAY)
         screen.blit(balance_label, (balance_x, balance_y))
         
         # Balance value with coin icon
@@ -80,9 +103,13 @@ class Dashboard:
         pygame.draw.circle(screen, self.GOLD, (balance_x + coin_size//2, balance_value_y + coin_size//2), coin_size//2)
         
         # Draw balance value
-        balance_text = self.button_font.render(f"{self.game_state.coins:.1f}", True, self.WHITE)
+        balance_text = render_text(self.button_font, f"{self.game_state.coins:.1f}", True, self.WHITE)
         screen.blit(balance_text, (balance_x + coin_size + 10, balance_value_y))
         
+        # Draw auto and burst buttons under the balance
+        if self.spawner:
+            self.draw_spawn_buttons(screen, balance_x, dashboard_y + 85)
+        
         # Draw risk selector (center)
         risk_x = width // 2 - 100
         risk_y = dashboard_y + 25
@@ -90,7 +117,7 @@ class Dashboard:
         # Risk label with icon
         risk_icon = "⚡"  # Lightning bolt emoji for risk
         risk_label_text = f"{risk_icon} RISK LEVEL"
-        risk_label = self.coin_font.render(risk_label_text, True, self.LIGHT_GRAY)
+        risk_label = render_text(self.coin_font, risk_label_text, True, self.LIGHT_GRAY)
         screen.blit(risk_label, (risk_x, risk_y))
         
         # Risk selector
@@ -98,7 +125,7 @@ class Dashboard:
         pygame.draw.rect(screen, self.GRAY, risk_bg, border_radius=5)
         
         # Risk selection
-        risk_text = self.button_font.render(self.risks[self.selected_risk], True, self.WHITE)
+        risk_text = render_text(self.button_font, self.risks[self.selected_risk], True, self.WHITE)
         risk_text_rect = risk_text.get_rect(center=(risk_bg.centerx, risk_bg.centery))
         screen.blit(risk_text, risk_text_rect)
         
@@ -125,7 +152,7 @@ class Dashboard:
         # Draw bet label with icon
         bet_icon = "🎯"  # Target emoji for betting
         bet_label_text = f"{bet_icon} BET AMOUNT"
-        bet_label = self.coin_font.render(bet_label_text, True, self.LIGHT_GRAY)
+        bet_label = render_text(self.coin_font, bet_label_text, True, self.LIGHT_GRAY)
         screen.blit(bet_label, (bet_x, bet_y))
         
         # Draw bet amount input
@@ -147,7 +174,7 @@ class Dashboard:
         pygame.draw.circle(screen, (200, 170, 0), (coin_x, coin_y), 8)
         
         # Amount text
-        amount_text = self.button_font.render(f"{self.amount:.1f}", True, self.WHITE)
+        amount_text = render_text(self.button_font, f"{self.amount:.1f}", True, self.WHITE)
         amount_rect = amount_text.get_rect(midleft=(coin_x + 20, bet_amount_bg.centery))
         screen.blit(amount_text, amount_rect)
         self.dashboard_buttons['amount'] = bet_amount_bg
@@ -160,7 +187,7 @@ class Dashboard:
         decrease_button = pygame.Rect(bet_x + bet_input_width + button_spacing, bet_y + 30, button_size, button_size)
         decrease_bg = self.DARK_BLUE if self.hovered_button == 'decrease' else self.BLUE
         pygame.draw.rect(screen, decrease_bg, decrease_button, border_radius=5)
-        decrease_text = self.button_font.render("-", True, self.WHITE)
+        decrease_text = render_text(self.button_font, "-", True, self.WHITE)
         decrease_rect = decrease_text.get_rect(center=decrease_button.center)
         screen.blit(decrease_text, decrease_rect)
         self.dashboard_buttons['decrease'] = decrease_button
@@ -169,7 +196,7 @@ class Dashboard:
         increase_button = pygame.Rect(decrease_button.right + button_spacing, bet_y + 30, button_size, button_size)
         increase_bg = self.DARK_BLUE if self.hovered_button == 'increase' else self.BLUE
         pygame.draw.rect(screen, increase_bg, increase_button, border_radius=5)
-        increase_text = self.button_font.render("+", True, self.WHITE)
+        increase_text = render_text(self.button_font, "+", True, self.WHITE)
         increase_rect = increase_text.get_rect(center=increase_button.center)
         screen.blit(increase_text, increase_rect)
         self.dashboard_buttons['increase'] = increase_button
@@ -178,7 +205,7 @@ class Dashboard:
         max_button = pygame.Rect(increase_button.right + button_spacing, bet_y + 30, 60, button_size)
         max_bg_color = (0, 140, 120) if self.hovered_button == 'max' else (0, 120, 100)
         pygame.draw.rect(screen, max_bg_color, max_button, border_radius=5)
-        max_text = self.button_font.render("MAX", True, self.WHITE)
+        max_text = render_text(self.button_font, "MAX", True, self.WHITE)
         max_text_rect = max_text.get_rect(center=max_button.center)
         screen.blit(max_text, max_text_rect)
         self.dashboard_buttons['max'] = max_button
@@ -199,7 +226,7 @@ class Dashboard:
                 pygame.draw.rect(screen, self.GRAY, preset_rect, border_radius=5)
                 
             # Preset text
-            preset_text = self.coin_font.render(f"{amount:.1f}", True, self.WHITE)
+            preset_text = render_text(self.coin_font, f"{amount:.1f}", True, self.WHITE)
             preset_text_rect = preset_text.get_rect(center=preset_rect.center)
             screen.blit(preset_text, preset_text_rect)
             self.dashboard_buttons[f'preset_{i}'] = preset_rect
@@ -228,18 +255,42 @@ class Dashboard:
         pygame.draw.rect(screen, play_color, play_button, border_radius=8)
         
         # Draw play text
-        play_text = self.title_font.render("DROP BALL", True, self.WHITE)
+        play_text = render_text(self.title_font, "DROP BALL", True, self.WHITE)
         play_text_rect = play_text.get_rect(center=play_button.center)
         screen.blit(play_text, play_text_rect)
         self.dashboard_buttons['drop_ball'] = play_button
             
+    def draw_spawn_buttons(self, screen, x, y):
+        """Draw the auto-bet toggle and burst buttons"""
+        button_width = 80
+        button_height = 26
+        
+        # Auto button shows how many queued drops remain while running
+        auto_button = pygame.Rect(x, y, button_width, button_height)
+        auto_pending = self.spawner.pending_from('auto')
+        if auto_pending:
+            auto_color = (200, 60, 60) if self.hovered_button == 'auto' else (170, 40, 40)
+            auto_label = f"STOP {auto_pending}"
+        else:
+            auto_color = self.DARK_BLUE if self.hovered_button == 'auto' else self.BLUE
+            auto_label = f"AUTO {self.auto_count}"
+        pygame.draw.rect(screen, auto_color, auto_button, border_radius=5)
+        auto_text = render_text(self.coin_font, auto_label, True, self.WHITE)
+        screen.blit(auto_text, auto_text.get_rect(center=auto_button.center))
+        self.dashboard_buttons['auto'] = auto_button
+        
+        # Burst button
+        burst_button = pygame.Rect(auto_button.right + 10, y, button_width, button_height)
+        burst_color = self.DARK_BLUE if self.hovered_button == 'burst' else self.BLUE
+        pygame.draw.rect(screen, burst_color, burst_button, border_radius=5)
+        burst_text = render_text(self.coin_font, f"BURST {self.burst_size}", True, self.WHITE)
+        screen.blit(burst_text, burst_text.get_rect(center=burst_button.center))
+        self.dashboard_buttons['burst'] = burst_button
+            
     def update_hover_state(self, pos):
         """Update which button is being hovered"""
-        self.hovered_button = None
-        for button_name, button_rect in self.dashboard_buttons.items():
-            if button_rect.collidepoint(pos):
-                self.hovered_button = button_name
-                break
+        self.hit_index.update(self.dashboard_buttons)
+        self.hovered_button = self.hit_index.hit(pos)
                 
     def handle_click(self, pos):
         """Handle mouse clicks on dashboard buttons"""
@@ -273,6 +324,17 @@ class Dashboard:
                         preset_amount = self.preset_amounts[preset_index]
                         self.amount = min(preset_amount, float(self.game_state.coins))
                     return True
+                elif button_name == 'auto':
+                    if self.spawner.pending_from('auto'):
+                        # Stop auto-bet and refund what it hasn't dropped yet (bursts keep going)
+                        self.spawner.cancel('auto')
+                    else:
+                        interval = max(1, round(60 / self.auto_rate))  # Ticks between drops
+                        self.spawner.enqueue(self.amount, self.auto_count, interval, source='auto')
+                    return True
+                elif button_name == 'burst':
+                    self.spawner.enqueue(self.amount, self.burst_size, 2, front=True, source='burst')
+                    return True
                 elif button_name == 'drop_ball':
                     # Ensure the coin balance updates properly
                     if self.amount > 0 and self.amount <= self.game_state.coins:
@@ -1,8 +1,21 @@
 import pygame
 import random
 from physics.ball_physics import BallPhysics
-from physics.game_objects import Ball, Pin
+from physics.batch_physics import BatchBallPhysics
+from physics.ball_collisions import resolve_ball_collisions
+from physics.pin_index import PinGrid
+from physics.outcome_cache import OutcomeCache
+from physics.trajectories import TrajectoryLibrary
+from physics import board
+from physics.game_objects import BallPool, Pin, ball_rect, ball_rects
+from physics.ball_sprites import BallSprites, RAINBOW_PALETTE, draw_plain_balls, draw_plain_batch
 from ui_components.dashboard import Dashboard
+from state.spawn_scheduler import SpawnScheduler
+from core.fonts import get_font
+from core.text_cache import render_text
+from core.simulation_thread import SimulationThread, Snapshot, BallState, BatchState
+from core.event_dispatch import HitIndex
+from core.frame_budget import QUALITY_FULL, QUALITY_NO_GLOW, QUALITY_PLAIN, QUALITY_NO_INTERPOLATION
 
 class GameScreen:
     """Game screen where gameplay happens"""
@@ -26,10 +39,21 @@ class GameScreen:
         
         # Initialize game elements
         self.balls = []  # Active balls
+        self.ball_pool = BallPool()  # Retired balls kept for reuse
+        self.playback_balls = []  # Balls replaying recorded trajectories
         self.pins = []  # Pins
         self.pin_positions = []  # Positions for collision
-        self.multipliers = [110, 41, 10, 5, 3, 2, 1.5, 1, 0.5, 0.3, 0.5, 1, 1.5, 2, 3, 5, 10, 41, 110]
+        self.multipliers = list(board.MULTIPLIERS)
         self.multiplier_rects = []
+        self.interpolation = 1.0  # Render blend between the last two physics ticks
+        self.quality = QUALITY_FULL  # Set by the main loop's frame budget (see core.frame_budget)
+        
+        # Background, pins and multiplier boxes pre-composited into one surface
+        self.static_layer = None
+        self.static_layer_key = None
+        self.board_version = 0  # Bumped whenever pins or zones are rebuilt
+        self.drawn_frame = None  # (layer, ball rects, widget states) last drawn by draw_dirty
+        self.ball_sprites = BallSprites()  # Pre-rendered balls per colour and flash level
         
         # Colors for multipliers (from highest to lowest)
         self.multiplier_colors = [
@@ -47,19 +71,52 @@ class GameScreen:
         
         # Set up physics engine
         self.physics = BallPhysics()
+        self.ball_collisions = settings_manager.get_setting('ball_collisions', False)
+        
+        # Optional vectorized engine for large ball counts (needs NumPy)
+        self.batch_physics = None
+        if (settings_manager.get_setting('physics_engine', 'scalar') == 'batch'
+                and BatchBallPhysics.available()):
+            self.batch_physics = BatchBallPhysics()
+        
+        # Continuous collision lets balls fall faster than the tunneling-safe speed cap
+        if settings_manager.get_setting('continuous_collision', False):
+            for engine in (self.physics, self.batch_physics):
+                if engine:
+                    engine.enable_continuous_collision(board.PIN_RADIUS,
+                                                       settings_manager.get_setting('max_vertical_speed'))
+        
+        # Recorded trajectories for playback mode, loaded once the board exists
+        self.trajectories = None
+        
+        # Precomputed outcome odds (filled by `python -m physics.simulation --cache ...`)
+        self.outcome_cache = OutcomeCache(settings_manager.get_setting('outcome_cache', 'outcome_cache.json'))
+        
+        # Auto/burst drops are queued and spawned a few ticks apart, with a cap on live balls
+        self.spawner = SpawnScheduler(game_state, self.request_spawn,
+                                      max_live=settings_manager.get_setting('max_live_balls', 300))
         
         # Set up UI elements
-        self.dashboard = Dashboard(settings_manager, self.drop_ball, game_state)
+        self.dashboard = Dashboard(settings_manager, self.drop_ball, game_state, self.spawner)
         self.hovered_button = None
+        self.hit_index = HitIndex()  # Hover lookups over the navigation buttons
         
         # Set up fonts
-        self.button_font = pygame.font.Font(None, 28)
-        self.multiplier_font = pygame.font.Font(None, 20)
+        self.button_font = get_font(28)
+        self.multiplier_font = get_font(20)
         
         # Initialize game elements
         self.create_pins()
         self.create_multiplier_zones()
         self.update_button_positions()
+        if settings_manager.get_setting('physics_engine', 'scalar') == 'playback':
+            self.load_trajectories()
+        
+        # Optionally run the balls on a worker thread; the render loop then draws its snapshots.
+        # It only runs while the screen is shown (see on_enter/on_exit).
+        self.simulation = None
+        if settings_manager.get_setting('simulation_thread', False):
+            self.simulation = SimulationThread(self.step_simulation, self.take_snapshot)
     
     def update_button_positions(self):
         """Update button positions for navigation"""
@@ -78,160 +135,260 @@ class GameScreen:
         """Create pins for the game board"""
         width, height = self.settings_manager.get_window_size()
         
-        pin_radius = 5
-        start_y = 100  # Starting Y position (moved up by 20px from 120)
-        vertical_spacing = 30  # Space between rows
-        horizontal_spacing = 30  # Space between pins in the same row
-        
-        # Calculate the width of the widest row to center the layout
-        max_pins_in_row = 17  # Bottom row
-        total_width = (max_pins_in_row - 1) * horizontal_spacing
-        start_x = (width - total_width) // 2
-        
-        # Clear previous pins
-        self.pins = []
-        self.pin_positions = []
+        # Create pins and store positions for collision detection
+        self.pin_positions = board.create_pin_positions(width)
+        self.pins = [Pin(x, y, board.PIN_RADIUS) for x, y in self.pin_positions]
+        self.board_version += 1
         
-        # Create pins row by row
-        for row in range(16):  # 16 rows total
-            # Calculate number of pins in this row
-            pins_in_row = row + 3  # First row has 3 pins, each row adds one more
-            
-            # Calculate x position for the first pin in this row to center the row
-            row_width = (pins_in_row - 1) * horizontal_spacing
-            row_start_x = (width - row_width) // 2
-            
-            # Create each pin in the row
-            for pin in range(pins_in_row):
-                x = row_start_x + (pin * horizontal_spacing)
-                y = start_y + (row * vertical_spacing)
-                
-                # Add pin
-                new_pin = Pin(x, y, pin_radius)
-                self.pins.append(new_pin)
-                
-                # Store position for collision detection
-                self.pin_positions.append((x, y))
+        # Index the pins on their lattice so each ball only tests its neighbours
+        self.physics.pin_index = PinGrid(self.pin_positions, cell_size=board.HORIZONTAL_SPACING,
+                                         reach=board.PIN_RADIUS + 10)
+        if self.batch_physics:
+            self.batch_physics.set_pins(self.pin_positions, self.physics.pin_index)
     
     def create_multiplier_zones(self):
         """Create multiplier zones at the bottom of the board"""
         width, height = self.settings_manager.get_window_size()
-        
-        # Position parameters
-        vertical_spacing = 30
-        horizontal_spacing = 30
-        start_y = 100  # Same as pins (moved up by 20px from 120)
-        multiplier_y = start_y + (15 * vertical_spacing) - 15  # Position below the last row of pins, moved up by 30px
-        
-        # Calculate position of the left-most multiplier
-        last_row_x = (width - ((16) * horizontal_spacing)) // 2 - 16
-        
-        # Clear previous rects
-        self.multiplier_rects = []
-        
-        # Create rectangles for each multiplier - ensure they fit the window width
-        multiplier_width = 26  # Slightly smaller width for better fit
-        multiplier_height = 35
-        
-        # Calculate total width needed and adjust horizontal spacing if needed
-        total_width_needed = multiplier_width * len(self.multipliers)
-        available_width = width - 40  # Leave some margin
-        
-        # Adjust spacing if needed to fit within window
-        if total_width_needed > available_width:
-            horizontal_spacing = max(20, (available_width - multiplier_width) / (len(self.multipliers) - 1))
-        
-        for i, multiplier in enumerate(self.multipliers):
-            # Calculate x position with new spacing
-            x = last_row_x + (i * horizontal_spacing)
-            
-            # Create rectangle with adjusted size
-            multiplier_rect = pygame.Rect(x - (multiplier_width // 2), multiplier_y,
-                                         multiplier_width, multiplier_height)
-            
-            self.multiplier_rects.append(multiplier_rect)
+        self.multiplier_rects = board.create_multiplier_rects(width, len(self.multipliers))
+        self.board_version += 1
+    
+    def load_trajectories(self):
+        """Load the trajectory library for playback mode, if one was recorded for this board"""
+        self.trajectories = None
+        path = self.settings_manager.get_setting('trajectory_library', 'trajectories')
+        try:
+            library = TrajectoryLibrary(path)
+        except (ImportError, OSError, ValueError):
+            return  # Fall back to live physics
+        if library.matches(self.pin_positions, self.multiplier_rects, self.multipliers, self.physics):
+            self.trajectories = library
+    
+    def get_outcome_odds(self):
+        """Get the cached per-zone odds and expected value for this board, or None if not computed"""
+        engine = 'batch' if self.batch_physics else 'scalar'  # Playback replays scalar-physics paths
+        return self.outcome_cache.lookup(self.pin_positions, self.multiplier_rects,
+                                         self.multipliers, self.physics, engine)
     
     def drop_ball(self, bet_amount):
         """Drop a new ball on the board"""
         # Check if bet is valid
         if bet_amount <= self.game_state.coins and bet_amount > 0:
-            width = self.settings_manager.get_setting('width')
-            
-            # Calculate starting position
-            center_x = width / 2
-            random_offset = random.uniform(-20, 20)  # Random starting position
-            ball_start_x = center_x + random_offset
-            ball_start_y = 70  # Start above the first row of pins (moved up by 20px from 90)
-            
-            # Choose ball color based on active skin
-            ball_color = (255, 200, 0)  # Default gold
-            
-            # Apply the correct skin color
-            active_skin = self.game_state.active_ball_skin
-            if active_skin == "gold":
-                ball_color = (255, 215, 0)  # Brighter gold
-            elif active_skin == "rainbow":
-                # Random color for rainbow effect
-                ball_color = (
-                    random.randint(150, 255),
-                    random.randint(150, 255),
-                    random.randint(150, 255)
-                )
-            elif active_skin == "ice":
-                ball_color = (100, 200, 255)  # Ice blue
-            elif active_skin == "fire":
-                ball_color = (255, 100, 0)  # Fire orange/red
-            
-            # Create new ball
-            new_ball = Ball(ball_start_x, ball_start_y, 9.5, ball_color, bet_amount)
-            new_ball.dy = 2  # Initial drop speed
-            # Add slight random horizontal velocity
-            new_ball.dx = random.uniform(-0.8, 0.8)
-            
-            # Apply lucky charm effect if active
-            if self.game_state.lucky_charm_active:
-                # Lucky charm gives slightly more favorable physics
-                new_ball.dx = random.uniform(-0.5, 0.5)  # Less horizontal variance
-            
-            self.balls.append(new_ball)
+            self.request_spawn(bet_amount)
             
             # Deduct bet amount from player's coins
             self.game_state.subtract_coins(bet_amount)
     
+    def request_spawn(self, bet_amount):
+        """Spawn a paid ball now, or hand it to the simulation thread if one is running"""
+        if self.simulation:
+            self.simulation.drops.put(bet_amount)
+        else:
+            self.spawn_ball(bet_amount)
+    
+    def spawn_ball(self, bet_amount):
+        """Put a ball whose bet is already paid onto the board"""
+        width = self.settings_manager.get_setting('width')
+        
+        # Calculate starting position
+        center_x = width / 2
+        random_offset = random.uniform(-20, 20)  # Random starting position
+        ball_start_x = center_x + random_offset
+        ball_start_y = board.BALL_START_Y  # Start above the first row of pins
+        
+        # Choose ball color based on active skin
+        ball_color = (255, 200, 0)  # Default gold
+        
+        # Apply the correct skin color
+        active_skin = self.game_state.active_ball_skin
+        if active_skin == "gold":
+            ball_color = (255, 215, 0)  # Brighter gold
+        elif active_skin == "rainbow":
+            # Random color for rainbow effect, from a fixed palette so sprites can be cached
+            ball_color = random.choice(RAINBOW_PALETTE)
+        elif active_skin == "ice":
+            ball_color = (100, 200, 255)  # Ice blue
+        elif active_skin == "fire":
+            ball_color = (255, 100, 0)  # Fire orange/red
+        
+        # Initial drop speed with slight random horizontal velocity
+        ball_dy = 2
+        ball_dx = random.uniform(-0.8, 0.8)
+        
+        # Apply lucky charm effect if active
+        if self.game_state.lucky_charm_active:
+            # Lucky charm gives slightly more favorable physics
+            ball_dx = random.uniform(-0.5, 0.5)  # Less horizontal variance
+        
+        # Create new ball
+        if self.trajectories:
+            # Replay a recorded path instead of simulating
+            self.playback_balls.append(self.trajectories.spawn(ball_color, bet_amount))
+        elif self.batch_physics:
+            self.batch_physics.add_ball(ball_start_x, ball_start_y, ball_dx, ball_dy,
+                                        board.BALL_RADIUS, ball_color, bet_amount)
+        else:
+            new_ball = self.ball_pool.acquire(ball_start_x, ball_start_y, board.BALL_RADIUS,
+                                              ball_color, bet_amount)
+            new_ball.dx = ball_dx
+            new_ball.dy = ball_dy
+            self.balls.append(new_ball)
+    
+    def live_ball_count(self):
+        """Count the balls currently in flight"""
+        if self.simulation:
+            # Balls in the latest snapshot plus drops the worker hasn't spawned yet
+            return self.simulation.snapshot.live + self.simulation.drops.qsize()
+        count = len(self.balls) + len(self.playback_balls)
+        if self.batch_physics:
+            count += self.batch_physics.count
+        return count
+    
+    def is_animating(self):
+        """Whether anything moves without input: balls in flight or drops still queued"""
+        return self.live_ball_count() > 0 or self.spawner.pending > 0
+    
     def update(self):
         """Update game elements"""
-        # Update dashboard
+        # Update dashboard and release queued drops
         self.dashboard.update()
+        self.spawner.update(self.live_ball_count())
         
+        if self.simulation:
+            # The worker moves the balls; just pay out what it reported
+            for amount in self.simulation.drain_wins():
+                self.on_win(amount)
+        else:
+            self.step_balls(self.on_win)
+    
+    def step_simulation(self):
+        """Advance the balls one tick on the simulation thread"""
+        for bet_amount in self.simulation.drain_drops():
+            self.spawn_ball(bet_amount)
+        self.step_balls(self.simulation.wins.put)
+    
+    def take_snapshot(self, tick):
+        """Capture what the renderer needs from every ball (simulation thread)"""
+        balls = tuple(BallState(ball.x, ball.y, ball.prev_x, ball.prev_y, ball.radius, ball.color,
+                                ball.collision_flash)
+                      for population in (self.balls, self.playback_balls) for ball in population)
+        batch = BatchState(self.batch_physics) if self.batch_physics else None
+        return Snapshot(tick, balls, batch)
+    
+    def step_balls(self, on_win):
+        """Move every ball one tick and settle the ones that landed, reporting wins to on_win"""
         width = self.settings_manager.get_setting('width')
         height = self.settings_manager.get_setting('height')
         
         # Define boundaries for ball physics
-        boundaries = {
-            'left': (width - ((16) * 30)) // 2 - 20,
-            'right': width - ((width - ((16) * 30)) // 2 - 20),
-            'bottom': height
-        }
+        boundaries = board.create_boundaries(width, height)
+        
+        # Step the whole population at once on the batch engine
+        if self.batch_physics:
+            self.batch_physics.step(boundaries)
+            if self.ball_collisions:
+                self.batch_physics.resolve_ball_collisions()
+            for bet_amount, zone in self.batch_physics.settle(self.multipliers, self.multiplier_rects,
+                                                              boundaries['bottom']):
+                if zone is not None:
+                    on_win(round(bet_amount * self.multipliers[zone], 2))
+        
+        # Advance balls replaying recorded paths
+        playback_balls = self.playback_balls
+        i = 0
+        while i < len(playback_balls):
+            ball = playback_balls[i]
+            ball.advance()
+            if ball.finished:
+                if ball.zone is not None:  # Replayed lost balls pay nothing
+                    on_win(round(ball.bet_amount * self.multipliers[ball.zone], 2))
+                self.swap_remove(playback_balls, i)
+            else:
+                i += 1
         
         # Update each ball
-        for ball in self.balls[:]:
+        balls = self.balls
+        i = 0
+        while i < len(balls):
+            ball = balls[i]
+            
             # Update ball physics
             self.physics.update_position(ball, self.pin_positions, boundaries)
             
             # Check for multiplier collisions and out-of-bounds
-            if ball.check_multiplier_collision(self.multipliers, self.multiplier_rects, self.on_win) or ball.is_out_of_bounds(boundaries['bottom']):
-                self.balls.remove(ball)
+            if ball.check_multiplier_collision(self.multipliers, self.multiplier_rects, on_win) or ball.is_out_of_bounds(boundaries['bottom']):
+                # The ball moved into slot i hasn't been updated yet, so don't advance
+                self.swap_remove(balls, i)
+                self.ball_pool.release(ball)
+            else:
+                i += 1
+        
+        # Let balls bounce off each other
+        if self.ball_collisions:
+            resolve_ball_collisions(self.balls)
+    
+    @staticmethod
+    def swap_remove(items, i):
+        """Remove items[i] in O(1) by moving the last item into its slot"""
+        last = items.pop()
+        if i < len(items):
+            items[i] = last
     
     def on_win(self, amount):
         """Handle winning event"""
         self.game_state.add_coins(amount)
     
-    def draw(self, screen):
-        """Draw the game screen"""
+    def get_static_layer(self):
+        """Get the pre-composited background, pins and multiplier boxes, rebuilding if stale"""
+        key = (self.settings_manager.get_window_size(),
+               self.settings_manager.get_setting('dark_mode', False),
+               self.board_version,
+               tuple(self.multipliers))
+        if self.static_layer is None or key != self.static_layer_key:
+            self.static_layer = self.build_static_layer()
+            self.static_layer_key = key
+        return self.static_layer
+    
+    def invalidate_static_layer(self):
+        """Force the static layer to be rebuilt on the next draw"""
+        self.static_layer = None
+    
+    def build_static_layer(self):
+        """Draw everything that doesn't change between frames onto a new surface"""
+        surface = pygame.Surface(self.settings_manager.get_window_size())
+        if pygame.display.get_surface():
+            surface = surface.convert()  # Match the display format so blits are plain copies
+        
         # Draw background gradient
-        self.draw_gradient_background(screen)
+        self.draw_gradient_background(surface)
         
-        # Draw lucky charm timer if active
+        # Draw pins with modernized look
+        for pin in self.pins:
+            pin.draw(surface)
+            
+        # Draw multiplier zones with better styling
+        for i, rect in enumerate(self.multiplier_rects):
+            multiplier = self.multipliers[i]
+            
+            # Calculate color based on multiplier value with smoother transition
+            color_index = min(9, int(10 * (1 - (multiplier - 0.3) / (110 - 0.3))))
+            color = self.multiplier_colors[color_index]
+                
+            # Draw multiplier box with rounded corners and border
+            pygame.draw.rect(surface, color, rect, border_radius=5)
+            
+            # Dark overlay at the top of the box for dimension
+            pygame.draw.rect(surface, (0, 0, 0, 50), 
+                            pygame.Rect(rect.left, rect.top, rect.width, rect.height//3),
+                            border_radius=5)
+            
+            # Draw multiplier text with better font
+            text = render_text(self.multiplier_font, f"{multiplier}x", True, self.WHITE)
+            text_rect = text.get_rect(center=rect.center)
+            surface.blit(text, text_rect)
+        return surface
+
+    def draw_lucky_charm_timer(self, screen):
+        """Draw the lucky charm countdown bar if the charm is active"""
         remaining = self.game_state.check_lucky_charm()
         if self.game_state.lucky_charm_active and remaining > 0:
             # Create a more modern timer display
@@ -253,41 +410,31 @@ class GameScreen:
             pygame.draw.rect(screen, self.GOLD, timer_fill, border_radius=4)
             
             # Create timer text
-            font = pygame.font.Font(None, 20)
-            timer_text = font.render(f"Lucky Charm: {minutes:02}:{seconds:02}", True, self.GOLD)
+            timer_text = render_text(get_font(20), f"Lucky Charm: {minutes:02}:{seconds:02}", True, self.GOLD)
             text_rect = timer_text.get_rect(midbottom=(timer_bg.centerx, timer_bg.top - 5))
             
             # Draw timer text
             screen.blit(timer_text, text_rect)
+    
+    def pin_snapshot(self):
+        """Fix which simulation snapshot and interpolation this frame draws, so every
+        part of the frame agrees even if the worker publishes mid-draw"""
+        if self.simulation:
+            self.frame_snapshot = self.simulation.snapshot
+            self.frame_alpha = self.simulation.get_alpha(self.frame_snapshot)
+    
+    def draw(self, screen):
+        """Draw the game screen"""
+        self.pin_snapshot()
+        
+        # Background, pins and multiplier zones in one blit
+        screen.blit(self.get_static_layer(), (0, 0))
+        
+        # Draw lucky charm timer if active
+        self.draw_lucky_charm_timer(screen)
         
-        # Draw pins with modernized look
-        for pin in self.pins:
-            pin.draw(screen)
-            
-        # Draw multiplier zones with better styling
-        for i, rect in enumerate(self.multiplier_rects):
-            multiplier = self.multipliers[i]
-            
-            # Calculate color based on multiplier value with smoother transition
-            color_index = min(9, int(10 * (1 - (multiplier - 0.3) / (110 - 0.3))))
-            color = self.multiplier_colors[color_index]
-                
-            # Draw multiplier box with rounded corners and border
-            pygame.draw.rect(screen, color, rect, border_radius=5)
-            
-            # Dark overlay at the top of the box for dimension
-            pygame.draw.rect(screen, (0, 0, 0, 50), 
-                            pygame.Rect(rect.left, rect.top, rect.width, rect.height//3),
-                            border_radius=5)
-            
-            # Draw multiplier text with better font
-            text = self.multiplier_font.render(f"{multiplier}x", True, self.WHITE)
-            text_rect = text.get_rect(center=rect.center)
-            screen.blit(text, text_rect)
-            
         # Draw active balls
-        for ball in self.balls:
-            ball.draw(screen)
+        self.draw_balls(screen)
         
         # Draw navigation buttons with modern icons
         self.draw_button_with_icon(screen, 'back', self.buttons['back'], "←")
@@ -295,6 +442,152 @@ class GameScreen:
             
         # Draw dashboard UI
         self.dashboard.draw(screen)
+        
+        # The next draw_dirty call has to start from a frame it drew itself
+        self.drawn_frame = None
+    
+    def get_ball_sources(self):
+        """Get (ball lists, batch engine or None, interpolation) to draw this frame.
+        
+        interpolation is None when the quality level skips it.
+        """
+        if self.simulation:
+            # The snapshot pinned for this frame
+            populations = (self.frame_snapshot.balls,)
+            batch = self.frame_snapshot.batch
+            alpha = self.frame_alpha
+        else:
+            populations = (self.balls, self.playback_balls)
+            batch = self.batch_physics
+            alpha = self.interpolation
+        if self.quality >= QUALITY_NO_INTERPOLATION:
+            alpha = None
+        return populations, batch, alpha
+    
+    def draw_balls(self, screen):
+        """Draw every live ball at the current quality level"""
+        populations, batch, alpha = self.get_ball_sources()
+        
+        # Flat circles when the frame budget is tight
+        if self.quality >= QUALITY_PLAIN:
+            for balls in populations:
+                draw_plain_balls(screen, balls, alpha)
+            if batch:
+                draw_plain_batch(screen, batch, alpha)
+            return
+        
+        # Otherwise from the sprite cache in one batched blit
+        glow = self.quality < QUALITY_NO_GLOW
+        blits = []
+        for balls in populations:
+            blits.extend(self.ball_sprites.get_blits(balls, alpha, glow))
+        if batch:
+            blits.extend(self.ball_sprites.get_batch_blits(batch, alpha, glow))
+        screen.blits(blits, doreturn=False)
+    
+    def get_ball_rects(self):
+        """Get the area each ball covers as draw_balls draws it"""
+        populations, batch, alpha = self.get_ball_sources()
+        if alpha is None:
+            alpha = 1.0
+        rects = [ball_rect(ball.prev_x + (ball.x - ball.prev_x) * alpha,
+                           ball.prev_y + (ball.y - ball.prev_y) * alpha, ball.radius)
+                 for balls in populations for ball in balls]
+        if batch:
+            # The engine or a BatchState snapshot of it
+            n = batch.count
+            rects.extend(ball_rects(batch.prev_x[:n], batch.prev_y[:n], batch.x[:n], batch.y[:n],
+                                    batch.radius[:n], alpha))
+        return rects
+    
+    def get_widget_states(self):
+        """Get {name: (rect, state)} for the overlays drawn on top of the board"""
+        dark_mode = self.settings_manager.get_setting('dark_mode', False)
+        widgets = {}
+        for button_name, button_rect in self.buttons.items():
+            # The circle's drop shadow is offset by 2px
+            widgets[button_name] = (button_rect.union(button_rect.move(2, 2)),
+                                    (button_name == self.hovered_button, dark_mode))
+        
+        remaining = self.game_state.check_lucky_charm()
+        if self.game_state.lucky_charm_active and remaining > 0:
+            # Countdown text sits above the bar, which is 150px wide, 20px from the right edge
+            timer_rect = pygame.Rect(self.settings_manager.get_setting('width') - 180, 30, 170, 35)
+            widgets['timer'] = (timer_rect, (self.game_state.get_lucky_charm_minutes_seconds(),
+                                             int(150 * remaining / 1200)))
+        
+        widgets['dashboard'] = (self.dashboard.get_rect(), self.dashboard.get_state())
+        return widgets
+    
+    def draw_dirty(self, screen):
+        """Redraw only the areas that changed since the last call.
+        
+        Returns the list of rects to push with pygame.display.update, or None
+        after a full redraw (the caller should flip the whole display).
+        """
+        self.pin_snapshot()
+        layer = self.get_static_layer()
+        ball_rects = self.get_ball_rects()
+        widgets = self.get_widget_states()
+        
+        # Full frame if there is nothing to diff against or the board itself changed
+        if self.drawn_frame is None or self.drawn_frame[0] is not layer:
+            self.draw(screen)  # Pins the snapshot again, so take the rects it drew
+            self.drawn_frame = (layer, self.get_ball_rects(), widgets)
+            return None
+        _, drawn_ball_rects, drawn_widgets = self.drawn_frame
+        
+        # Where balls were and are now, plus widgets that changed or disappeared
+        dirty = drawn_ball_rects + ball_rects
+        for name, (rect, state) in drawn_widgets.items():
+            if widgets.get(name) != (rect, state):
+                dirty.append(rect)
+        for name, (rect, state) in widgets.items():
+            if drawn_widgets.get(name) != (rect, state):
+                dirty.append(rect)
+        
+        # Buttons and the timer blend text onto what is below, so restore them whole before
+        # redrawing; the dashboard paints an opaque panel first and can be redrawn over itself
+        for name, (rect, state) in widgets.items():
+            if name != 'dashboard' and rect.collidelist(dirty) != -1:
+                dirty.append(rect)
+        
+        # Restore the dirty areas from the static layer, then redraw what overlaps them
+        screen_rect = screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+        for rect in dirty:
+            screen.blit(layer, rect, rect)
+        if 'timer' in widgets and widgets['timer'][0].collidelist(dirty) != -1:
+            self.draw_lucky_charm_timer(screen)
+        self.draw_balls(screen)
+        for button_name, icon in (('back', "←"), ('shop', "$")):
+            if widgets[button_name][0].collidelist(dirty) != -1:
+                self.draw_button_with_icon(screen, button_name, self.buttons[button_name], icon)
+        if widgets['dashboard'][0].collidelist(dirty) != -1:
+            self.dashboard.draw(screen)
+        
+        self.drawn_frame = (layer, ball_rects, widgets)
+        return dirty
+    
+    def on_enter(self):
+        """Resume the board where it was left, balls in flight included"""
+        if self.simulation:
+            self.simulation.start()
+    
+    def on_exit(self):
+        """Pause the board while another screen is shown"""
+        # Refund drops that haven't spawned before leaving the board
+        self.spawner.cancel()
+        if self.simulation:
+            self.simulation.stop()
+            # Settle what the worker reported before stopping, and refund bets it never spawned,
+            # so the balance is current while away (and nothing is lost if the screen is rebuilt)
+            for amount in self.simulation.drain_wins():
+                self.on_win(amount)
+            for bet_amount in self.simulation.drain_drops():
+                self.game_state.add_coins(bet_amount)
+        self.outcome_cache.flush()  # Keep the recency of tables looked up while playing
+        self.hovered_button = None
     
     def handle_click(self, pos):
         """Handle mouse clicks"""
@@ -311,11 +604,8 @@ class GameScreen:
     
     def update_hover_state(self, pos):
         """Update hover state of buttons"""
-        self.hovered_button = None
-        for button_name, button_rect in self.buttons.items():
-            if button_rect.collidepoint(pos):
-                self.hovered_button = button_name
-                break
+        self.hit_index.update(self.buttons)
+        self.hovered_button = self.hit_index.hit(pos)
                 
         # Update dashboard hover state
         self.dashboard.update_hover_state(pos)
@@ -372,8 +662,7 @@ class GameScreen:
         pygame.draw.circle(screen, button_bg, button_rect.center, button_rect.width // 2)
         
         # Draw icon
-        icon_font = pygame.font.Font(None, 36)
-        icon_text = icon_font.render(icon, True, text_color)
+        icon_text = render_text(get_font(36), icon, True, text_color)
         icon_rect = icon_text.get_rect(center=button_rect.center)
         screen.blit(icon_text, icon_rect)
         
@@ -401,6 +690,6 @@ class GameScreen:
         pygame.draw.rect(screen, button_bg, button_rect, border_radius=5)
         
         # Draw text
-        text_surf = self.button_font.render(text, True, text_color)
+        text_surf = render_text(self.button_font, text, True, text_color)
         text_rect = text_surf.get_rect(center=button_rect.center)
         screen.blit(text_surf, text_rect) 
\ No newline at end of file
@@ -0,0 +1,175 @@
+import math
+import random
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; ParticleSystem falls back to plain lists
+    np = None
+
+# Alpha is drawn in steps of this size so sprites can be shared
+ALPHA_STEP = 17
+
+def render_dot(color, radius, alpha):
+    """Sprite for a plain translucent dot (menu sparkles, win bursts)"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+    return surface
+
+def render_glow_ball(color, radius, alpha):
+    """Sprite for a decorative menu ball with a faint glow"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+    pygame.draw.circle(surface, (*color, alpha // 3), (radius, radius), radius + 2)
+    return surface
+
+class ParticleSystem:
+    """Fixed-capacity particles stored as parallel arrays.
+
+    Each particle moves in a straight line, optionally bounces inside bounds
+    and fades out as its lifetime runs down (lifetime None lives forever).
+    Drawing uses one cached sprite per colour, whole-pixel radius and alpha
+    step, blitted in a single Surface.blits() call.
+    """
+
+    FIELDS = ('x', 'y', 'dx', 'dy', 'size', 'lifetime', 'alpha', 'color')
+
+    def __init__(self, capacity=256, render_sprite=render_dot, bounds=None, fade=2.55):
+        self.capacity = capacity
+        self.render_sprite = render_sprite
+        self.bounds = bounds  # (width, height) to bounce inside, or None
+        self.fade = fade  # Alpha lost per tick of lifetime left below full
+        self.count = 0
+
+        self.colors = []  # Palette; particles store an index into it
+        self.color_index = {}
+        self.sprites = {}
+
+        if np is not None:
+            for name in self.FIELDS:
+                dtype = np.int32 if name == 'color' else np.float64
+                setattr(self, name, np.zeros(capacity, dtype=dtype))
+        else:
+            for name in self.FIELDS:
+                setattr(self, name, [0] * capacity)
+
+    def emit(self, x, y, dx, dy, size, color, lifetime=None, alpha=255):
+        """Add a particle. Returns False if the system is full."""
+        if self.count >= self.capacity:
+            return False
+        if color not in self.color_index:
+            self.color_index[color] = len(self.colors)
+            self.colors.append(color)
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.size[i] = size
+        self.lifetime[i] = math.inf if lifetime is None else lifetime
+        self.alpha[i] = alpha
+        self.color[i] = self.color_index[color]
+        self.count += 1
+        return True
+
+    def burst(self, x, y, count, color, speed=3.0, size=(2, 5), lifetime=60):
+        """Emit count particles flying out from (x, y) in random directions"""
+        for _ in range(count):
+            angle = random.uniform(0, 2 * math.pi)
+            velocity = random.uniform(0.3, 1.0) * speed
+            if not self.emit(x, y, math.cos(angle) * velocity, math.sin(angle) * velocity,
+                             random.uniform(*size), color, lifetime):
+                break
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def update(self):
+        """Move every particle one tick, bounce it off the bounds and drop expired ones"""
+        if np is not None:
+            self.update_arrays()
+        else:
+            self.update_lists()
+
+    def update_arrays(self):
+        """Vectorized update with NumPy"""
+        n = self.count
+        x, y, dx, dy = self.x[:n], self.y[:n], self.dx[:n], self.dy[:n]
+        x += dx
+        y += dy
+        if self.bounds:
+            width, height = self.bounds
+            dx[(x < 0) | (x > width)] *= -1
+            dy[(y < 0) | (y > height)] *= -1
+
+        lifetime = self.lifetime[:n]
+        lifetime -= 1
+        alive = lifetime > 0
+        if not alive.all():
+            # Pack the survivors at the front, keeping their order
+            keep = np.flatnonzero(alive)
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def update_lists(self):
+        """Per-particle update without NumPy"""
+        width, height = self.bounds or (None, None)
+        i = 0
+        while i < self.count:
+            self.x[i] += self.dx[i]
+            self.y[i] += self.dy[i]
+            if width is not None:
+                if self.x[i] < 0 or self.x[i] > width:
+                    self.dx[i] *= -1
+                if self.y[i] < 0 or self.y[i] > height:
+                    self.dy[i] *= -1
+
+            self.lifetime[i] -= 1
+            if self.lifetime[i] <= 0:
+                # Move the last particle into this slot; it hasn't been updated yet
+                self.count -= 1
+                for name in self.FIELDS:
+                    array = getattr(self, name)
+                    array[i] = array[self.count]
+            else:
+                i += 1
+
+    def get_sprite(self, color, radius, alpha):
+        """Get the sprite for a colour index, radius and alpha step, rendering it on first use"""
+        key = (color, radius, alpha)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.render_sprite(self.colors[color], radius, alpha)
+            if pygame.display.get_surface():
+                sprite = sprite.convert_alpha()
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        """Draw every particle with one batched blit"""
+        n = self.count
+        if not n:
+            return
+        if np is not None:
+            alpha = np.minimum(self.alpha[:n], self.lifetime[:n] * self.fade)
+            alphas = (np.rint(alpha / ALPHA_STEP) * ALPHA_STEP).astype(int).tolist()
+            radii = self.size[:n].astype(int).tolist()
+            lefts = (self.x[:n] - self.size[:n]).astype(int).tolist()
+            tops = (self.y[:n] - self.size[:n]).astype(int).tolist()
+            colors = self.color[:n].tolist()
+        else:
+            alphas = [round(min(self.alpha[i], self.lifetime[i] * self.fade) / ALPHA_STEP) * ALPHA_STEP
+                      for i in range(n)]
+            radii = [int(size) for size in self.size[:n]]
+            lefts = [int(self.x[i] - self.size[i]) for i in range(n)]
+            tops = [int(self.y[i] - self.size[i]) for i in range(n)]
+            colors = self.color[:n]
+
+        get_sprite = self.get_sprite
+        screen.blits([(get_sprite(colors[i], radii[i], alphas[i]), (lefts[i], tops[i]))
+                      for i in range(n)], doreturn=False)